@@ -439,6 +439,12 @@ class BdCliClient(BdClientBase):
         if not isinstance(data, list):
             return []
 
+        if not params.include_dependencies:
+            # Drop nested issues before validation rather than after
+            for issue in data:
+                issue.pop("dependencies", None)
+                issue.pop("dependents", None)
+
         return [Issue.model_validate(issue) for issue in data]
 
     async def show(self, params: ShowIssueParams) -> Issue:
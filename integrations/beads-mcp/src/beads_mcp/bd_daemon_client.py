@@ -413,6 +413,11 @@ class BdDaemonClient(BdClientBase):
         issues_data = json.loads(data) if isinstance(data, str) else data
         if issues_data is None:
             return []
+        if not params.include_dependencies:
+            # Drop nested issues before validation rather than after
+            for issue in issues_data:
+                issue.pop("dependencies", None)
+                issue.pop("dependents", None)
         return [Issue(**issue) for issue in issues_data]
 
     async def show(self, params: ShowIssueParams) -> Issue:
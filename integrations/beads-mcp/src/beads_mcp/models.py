@@ -9,7 +9,9 @@ from pydantic import BaseModel, Field, field_validator
 IssueStatus = Literal["open", "in_progress", "blocked", "deferred", "closed"]
 IssueType = Literal["bug", "feature", "task", "epic", "chore"]
 DependencyType = Literal["blocks", "related", "parent-child", "discovered-from"]
-OperationAction = Literal["created", "updated", "closed", "reopened"]
+OperationAction = Literal[
+    "created", "updated", "closed", "reopened", "dep_added", "dep_removed", "comment_added"
+]
 
 
 # =============================================================================
@@ -223,6 +225,7 @@ class ListIssuesParams(BaseModel):
     query: str | None = None  # Search in title (case-insensitive)
     unassigned: bool = False  # Filter to only unassigned issues
     limit: int = Field(default=20, ge=1, le=100)  # Reduced to avoid MCP buffer overflow
+    include_dependencies: bool = True  # False: skip parsing dependencies/dependents
 
 
 class ShowIssueParams(BaseModel):
@@ -231,6 +234,13 @@ class ShowIssueParams(BaseModel):
     issue_id: str
 
 
+class BatchCall(BaseModel):
+    """A single tool call inside batch_execute."""
+
+    tool: str
+    args: dict[str, Any] = Field(default_factory=dict)
+
+
 class Stats(BaseModel):
     """Beads task statistics."""
 
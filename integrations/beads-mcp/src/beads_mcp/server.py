@@ -18,13 +18,21 @@ import os
 import signal
 import subprocess
 import sys
-from functools import wraps
-from types import FrameType
-from typing import Any, Awaitable, Callable, TypeVar
+import threading
+import time
+import uuid
+import weakref
+from functools import lru_cache, partial, wraps
+from types import FrameType, MappingProxyType
+from typing import Any, Awaitable, Callable, Coroutine, Final, NamedTuple, TypeVar
 
 from fastmcp import FastMCP
+from fastmcp.tools.tool import FunctionTool, ToolResult
+from fastmcp.utilities.types import get_cached_typeadapter
+from pydantic import TypeAdapter
 
 from beads_mcp.models import (
+    BatchCall,
     BlockedIssue,
     BriefDep,
     BriefIssue,
@@ -35,6 +43,8 @@ from beads_mcp.models import (
     IssueMinimal,
     IssueStatus,
     IssueType,
+    LinkedIssue,
+    OperationAction,
     OperationResult,
     Stats,
 )
@@ -60,25 +70,64 @@ from beads_mcp.tools import (
     beads_update_issue,
     beads_validate,
     current_workspace,  # ContextVar for per-request workspace routing
+    _GIT_TIMEOUT,
+    _beads_db_path,
+    _find_git_root,
 )
 
-# Setup logging for lifecycle events
+# Setup logging for lifecycle events (leave host-configured logging alone)
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    stream=sys.stderr,  # Ensure logs don't pollute stdio protocol
-)
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,  # Ensure logs don't pollute stdio protocol
+    )
 
 T = TypeVar("T")
 
-# Global state for cleanup
-_daemon_clients: list[Any] = []
+# Global state for cleanup: daemon clients with a cleanup() method.
+# Weak references so clients dropped from the connection pool don't linger here.
+_daemon_clients: "weakref.WeakSet[Any]" = weakref.WeakSet()
 _cleanup_done = False
 
+
+class _WorkspaceContext(NamedTuple):
+    """Persistent workspace context recorded by context(action="set")."""
+
+    working_dir: str | None = None
+    db: str | None = None
+    context_set: bool = False
+
+
 # Persistent workspace context (survives across MCP tool calls)
-# os.environ doesn't persist across MCP requests, so we need module-level storage
-_workspace_context: dict[str, str] = {}
+# os.environ doesn't persist across MCP requests, so we need module-level storage.
+# Immutable and replaced as a whole, so readers never see a half-applied update.
+_workspace_context = _WorkspaceContext()
+
+# Enforce context before write operations (process-lifetime flag, read once)
+_REQUIRE_CONTEXT: Final[bool] = os.environ.get("BEADS_REQUIRE_CONTEXT") == "1"
+
+# Database paths found by _find_beads_db, keyed by workspace root
+_db_cache: dict[str, str] = {}
+
+# Rendered context(action="show") output, keyed by the context and env values it shows
+_show_cache: tuple[tuple[Any, ...], str] | None = None
+
+# Recent stats() results per workspace as (monotonic time, Stats); cleared by write tools,
+# which also bump _stats_generation so a stats() call racing a write doesn't store its result
+_stats_cache: dict[str | None, tuple[float, Stats]] = {}
+_stats_generation = 0
+_STATS_TTL: Final[float] = 2.0
+
+# Seconds in-flight tool calls get to finish after SIGTERM/SIGINT before exit is forced
+_SHUTDOWN_GRACE: Final[float] = 2.0
+
+# Background admin jobs by job ID; an entry is dropped once poll_job reports it finished,
+# or _JOB_TTL seconds after it finished if nobody polls it
+_jobs: dict[str, "asyncio.Task[Any]"] = {}
+_job_finished: dict[str, float] = {}
+_JOB_TTL: Final[float] = 600.0
 
 # =============================================================================
 # CONTEXT ENGINEERING: Compaction Settings (Configurable via Environment)
@@ -88,45 +137,34 @@ _workspace_context: dict[str, str] = {}
 #   BEADS_MCP_COMPACTION_THRESHOLD - Compact results with >N issues (default: 20)
 #   BEADS_MCP_PREVIEW_COUNT - Show first N issues in preview (default: 5)
 
-def _get_compaction_settings() -> tuple[int, int]:
-    """Load compaction settings from environment or use defaults.
-    
-    Returns:
-        (threshold, preview_count) tuple
-    """
-    import os
-    
-    threshold = int(os.environ.get("BEADS_MCP_COMPACTION_THRESHOLD", "20"))
-    preview_count = int(os.environ.get("BEADS_MCP_PREVIEW_COUNT", "5"))
-    
-    # Validate settings
-    if threshold < 1:
-        raise ValueError("BEADS_MCP_COMPACTION_THRESHOLD must be >= 1")
-    if preview_count < 1:
-        raise ValueError("BEADS_MCP_PREVIEW_COUNT must be >= 1")
-    if preview_count > threshold:
-        raise ValueError("BEADS_MCP_PREVIEW_COUNT must be <= BEADS_MCP_COMPACTION_THRESHOLD")
-    
-    return threshold, preview_count
-
+COMPACTION_THRESHOLD: Final[int] = int(os.environ.get("BEADS_MCP_COMPACTION_THRESHOLD", "20"))
+PREVIEW_COUNT: Final[int] = int(os.environ.get("BEADS_MCP_PREVIEW_COUNT", "5"))
 
-COMPACTION_THRESHOLD, PREVIEW_COUNT = _get_compaction_settings()
+# Validate settings
+if COMPACTION_THRESHOLD < 1:
+    raise ValueError("BEADS_MCP_COMPACTION_THRESHOLD must be >= 1")
+if PREVIEW_COUNT < 1:
+    raise ValueError("BEADS_MCP_PREVIEW_COUNT must be >= 1")
+if PREVIEW_COUNT > COMPACTION_THRESHOLD:
+    raise ValueError("BEADS_MCP_PREVIEW_COUNT must be <= BEADS_MCP_COMPACTION_THRESHOLD")
 
 if os.environ.get("BEADS_MCP_COMPACTION_THRESHOLD"):
     logger.info(f"Using BEADS_MCP_COMPACTION_THRESHOLD={COMPACTION_THRESHOLD}")
 if os.environ.get("BEADS_MCP_PREVIEW_COUNT"):
     logger.info(f"Using BEADS_MCP_PREVIEW_COUNT={PREVIEW_COUNT}")
 
-# Create FastMCP server
-mcp = FastMCP(
-    name="Beads",
-    instructions="""
-We track work in Beads (bd) instead of Markdown.
-Check the resource beads://quickstart to see how.
+# =============================================================================
+# CONTEXT ENGINEERING: Progressive Tool Loading (Opt-in via Environment)
+# =============================================================================
+#   BEADS_MCP_PROGRESSIVE=1 - List only discovery tools (discover_tools, get_tool_info,
+#   load_tool, context) at session start; other tools are enabled on first
+#   get_tool_info()/load_tool() call so clients don't load every schema up front.
 
-IMPORTANT: Call context(action="set", workspace_root="...") before write operations.
+PROGRESSIVE_TOOLS: Final[bool] = os.environ.get("BEADS_MCP_PROGRESSIVE") == "1"
 
-## Quick Reference (11 tools)
+# Tool reference served on demand as the beads://usage resource
+_USAGE_GUIDE_TEXT = """
+## Quick Reference (13 tools)
 
 | Action | Tool | Example |
 |--------|------|---------|
@@ -141,11 +179,13 @@ IMPORTANT: Call context(action="set", workspace_root="...") before write operati
 | Comments | comment(action="add|list", ...) | Track progress |
 | Statistics | stats() | Project overview |
 | Admin | admin(action="validate|repair|...", ...) | Diagnostics |
+| Background admin | admin(..., background=True) then poll_job(job_id) | Long scans without blocking |
 | Context | context(action="set|show|init", ...) | Workspace setup |
+| Batch | batch_execute(calls=[{"tool": "show", "args": {...}}, ...]) | Several calls, one request |
 
 ## Token Optimization
 
-- `brief=True`: Returns only {id, title, status} - use when scanning
+- `brief=True`: Returns only {id, title, status, priority} - use when scanning
 - `fields=["id", "dependencies"]`: Returns only specific fields
 - `max_description_length=100`: Truncates long descriptions
 - Write ops return minimal confirmation by default (use `brief=False` for full)
@@ -157,9 +197,30 @@ IMPORTANT: Call context(action="set", workspace_root="...") before write operati
 - `labels_any=["p0", "p1"]`: Issues with ANY specified label (OR)
 - `query="search term"`: Search in title/description
 - `unassigned=True`: Issues with no assignee
-""",
+"""
+
+# Normalize once at import: drop trailing whitespace and surrounding blank lines
+_USAGE_GUIDE: Final[str] = "\n".join(line.rstrip() for line in _USAGE_GUIDE_TEXT.splitlines()).strip()
+
+# Server instructions (shipped to the client on every session, so kept to the essentials)
+_INSTRUCTIONS: Final[str] = (
+    "We track work in Beads (bd) instead of Markdown. "
+    'IMPORTANT: Call context(action="set", workspace_root="...") before write operations. '
+    "Read the resource beads://usage for the tool reference and beads://quickstart for bd itself."
 )
 
+# Create FastMCP server
+mcp = FastMCP(name="Beads", instructions=_INSTRUCTIONS)
+
+
+def register_daemon_client(client: Any) -> None:
+    """Register a client so its cleanup() runs when the server shuts down.
+    
+    Clients without a cleanup() method (e.g. the CLI client) are ignored.
+    """
+    if callable(getattr(client, "cleanup", None)):
+        _daemon_clients.add(client)
+
 
 def cleanup() -> None:
     """Clean up resources on exit.
@@ -176,15 +237,25 @@ def cleanup() -> None:
     logger.info("Cleaning up beads-mcp resources...")
     
     # Close all daemon client connections
-    for client in _daemon_clients:
+    for client in list(_daemon_clients):
         try:
-            if hasattr(client, 'cleanup'):
-                client.cleanup()
-                logger.debug(f"Closed daemon client: {client}")
+            client.cleanup()
+            logger.debug("Closed daemon client: %s", client)
         except Exception as e:
-            logger.warning(f"Error closing daemon client: {e}")
+            logger.warning("Error closing daemon client: %s", e)
     
     _daemon_clients.clear()
+
+    # Cancel background admin jobs that are still running
+    for task in _jobs.values():
+        if not task.done():
+            try:
+                task.cancel()
+            except Exception as e:
+                logger.warning("Error cancelling background job: %s", e)
+
+    _jobs.clear()
+    _job_finished.clear()
     logger.info("Cleanup complete")
 
 
@@ -196,97 +267,135 @@ def signal_handler(signum: int, frame: FrameType | None) -> None:
     sys.exit(0)
 
 
-# Register cleanup handlers
-atexit.register(cleanup)
-signal.signal(signal.SIGTERM, signal_handler)
-signal.signal(signal.SIGINT, signal_handler)
+def _install_lifecycle_handlers() -> None:
+    """Register cleanup for interpreter exit and SIGTERM/SIGINT.
+
+    Called from main() rather than at import, so importing this module
+    (tests, subprocesses, embedding hosts) doesn't take over signal handling.
+    """
+    atexit.register(cleanup)
 
-# Get version from package metadata
-try:
-    __version__ = importlib.metadata.version("beads-mcp")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "dev"
+    # signal.signal() may only be called from the main thread
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if sys.platform != "win32":
+        signal.signal(signal.SIGTERM, signal_handler)
+    signal.signal(signal.SIGINT, signal_handler)
 
-logger.info(f"beads-mcp v{__version__} initialized with lifecycle management")
 
+_version_cache: str | None = None
 
-def with_workspace(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
-    """Decorator to set workspace context for the duration of a tool call.
 
-    Extracts workspace_root parameter from tool call kwargs, resolves it,
-    and sets current_workspace ContextVar for the request duration.
-    Falls back to persistent context or BEADS_WORKING_DIR if workspace_root not provided.
+def get_version() -> str:
+    """Get the beads-mcp version, resolved on first use and cached.
 
-    This enables per-request workspace routing for multi-project support.
+    BEADS_MCP_VERSION overrides the package metadata lookup, which is
+    comparatively slow and otherwise paid by every process importing this module.
     """
-    @wraps(func)
-    async def wrapper(*args: Any, **kwargs: Any) -> T:
-        # Extract workspace_root parameter (if provided)
-        workspace_root = kwargs.get('workspace_root')
-
-        # Determine workspace: parameter > persistent context > env > None
-        workspace = (
-            workspace_root
-            or _workspace_context.get("BEADS_WORKING_DIR")
-            or os.environ.get("BEADS_WORKING_DIR")
-        )
+    global _version_cache
 
-        # Set ContextVar for this request
-        token = current_workspace.set(workspace)
+    if _version_cache is None:
+        version = os.environ.get("BEADS_MCP_VERSION")
+        if not version:
+            try:
+                version = importlib.metadata.version("beads-mcp")
+            except importlib.metadata.PackageNotFoundError:
+                version = "dev"
+        _version_cache = version
+    return _version_cache
 
-        try:
-            # Execute tool with workspace context set
-            return await func(*args, **kwargs)
-        finally:
-            # Always reset ContextVar after tool completes
-            current_workspace.reset(token)
 
-    return wrapper
+def __getattr__(name: str) -> Any:
+    """Resolve __version__ lazily (PEP 562)."""
+    if name == "__version__":
+        return get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def require_context(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
-    """Decorator to enforce context has been set before write operations.
-    
-    Passes if either:
-    - workspace_root was provided on tool call (via ContextVar), OR
-    - BEADS_WORKING_DIR is set (from set_context)
-    
-    Only enforces if BEADS_REQUIRE_CONTEXT=1 is set in environment.
-    This allows backward compatibility while adding safety for multi-repo setups.
+def tool_entry(
+    require_context: bool = False,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorator factory for tool entry points: workspace routing and context checks.
+
+    Extracts workspace_root parameter from tool call kwargs, resolves it,
+    and sets current_workspace ContextVar for the request duration.
+    Falls back to persistent context or BEADS_WORKING_DIR if workspace_root not provided.
+    This enables per-request workspace routing for multi-project support.
+
+    With require_context=True (write operations), the call is rejected when no
+    workspace could be determined. Only enforced if BEADS_REQUIRE_CONTEXT=1 is
+    set in environment, for backward compatibility with single-repo setups.
+
+    Both steps run in one wrapper so each tool call adds a single frame.
     """
-    @wraps(func)
-    async def wrapper(*args: Any, **kwargs: Any) -> T:
-        # Only enforce if explicitly enabled
-        if os.environ.get("BEADS_REQUIRE_CONTEXT") == "1":
-            # Check ContextVar or environment
-            workspace = current_workspace.get() or os.environ.get("BEADS_WORKING_DIR")
-            if not workspace:
+    enforce = require_context and _REQUIRE_CONTEXT
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        # Bind lookups once per decorated tool rather than on every call
+        get_workspace = current_workspace.get
+        set_workspace = current_workspace.set
+        reset_workspace = current_workspace.reset
+        env_get = os.environ.get
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            # Determine workspace: parameter > persistent context > env > None
+            workspace = (
+                kwargs.get('workspace_root')
+                or _workspace_context.working_dir
+                or env_get("BEADS_WORKING_DIR")
+            )
+
+            if enforce and not workspace:
                 raise ValueError(
                     "Context not set. Either provide workspace_root parameter or call set_context() first."
                 )
-        return await func(*args, **kwargs)
-    return wrapper
+
+            # Already routed to this workspace (steady state): skip the set/reset pair
+            if get_workspace() == workspace:
+                return await func(*args, **kwargs)
+
+            # Set ContextVar for this request
+            token = set_workspace(workspace)
+
+            try:
+                # Execute tool with workspace context set
+                return await func(*args, **kwargs)
+            finally:
+                # Always reset ContextVar after tool completes
+                reset_workspace(token)
+
+        return wrapper
+
+    return decorator
 
 
 def _find_beads_db(workspace_root: str) -> str | None:
     """Find .beads/*.db by walking up from workspace_root.
     
+    Hits are cached per workspace root and rechecked with a single stat, so a
+    removed or renamed database triggers a fresh walk. The cache is also
+    cleared by context(action="init").
+    
     Args:
         workspace_root: Starting directory to search from
         
     Returns:
-        Absolute path to first .db file found in .beads/, None otherwise
+        Absolute path to first .db file found in .beads/ (excluding backups), None otherwise
     """
-    import glob
+    cached = _db_cache.get(workspace_root)
+    if cached is not None:
+        if os.path.isfile(cached):
+            return cached
+        del _db_cache[workspace_root]
+
     current = os.path.abspath(workspace_root)
     
     while True:
-        beads_dir = os.path.join(current, ".beads")
-        if os.path.isdir(beads_dir):
-            # Find any .db file in .beads/
-            db_files = glob.glob(os.path.join(beads_dir, "*.db"))
-            if db_files:
-                return db_files[0]  # Return first .db file found
+        db_path = _beads_db_path(current)
+        if db_path is not None:
+            _db_cache[workspace_root] = db_path
+            return db_path
         
         parent = os.path.dirname(current)
         if parent == current:  # Reached root
@@ -296,15 +405,30 @@ def _find_beads_db(workspace_root: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=64)
 def _resolve_workspace_root(path: str) -> str:
     """Resolve workspace root to git repo root if inside a git repo.
     
+    Results are memoized to avoid spawning git on every context(action="set");
+    callers should pass an absolute path so the cache key is canonical.
+    The cache is cleared by context(action="init").
+    
     Args:
         path: Directory path to resolve
         
     Returns:
         Git repo root if inside git repo, otherwise the original path
+
+    Raises:
+        subprocess.TimeoutExpired: If git ran longer than _GIT_TIMEOUT (it has been killed)
     """
+    path = os.path.abspath(path)
+
+    # Fast path: find .git on disk; only ask git when no marker is visible
+    git_root = _find_git_root(path)
+    if git_root is not None:
+        return git_root
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -314,18 +438,22 @@ def _resolve_workspace_root(path: str) -> str:
             check=False,
             shell=sys.platform == "win32",
             stdin=subprocess.DEVNULL,  # Prevent inheriting MCP's stdin
+            timeout=_GIT_TIMEOUT,
         )
         if result.returncode == 0:
             return result.stdout.strip()
+    except subprocess.TimeoutExpired:
+        raise  # Reported by context(action="set"); not cached by lru_cache
     except Exception as e:
-        logger.debug(f"Git detection failed for {path}: {e}")
+        logger.debug("Git detection failed for %s: %s", path, e)
         pass
     
-    return os.path.abspath(path)
+    return path
 
 
 # Register quickstart resource
 @mcp.resource("beads://quickstart", name="Beads Quickstart Guide")
+@tool_entry()
 async def get_quickstart() -> str:
     """Get beads (bd) quickstart guide.
 
@@ -334,6 +462,12 @@ async def get_quickstart() -> str:
     return await beads_quickstart()
 
 
+@mcp.resource("beads://usage", name="Beads MCP Tool Reference")
+async def get_usage() -> str:
+    """Get the beads MCP tool reference: tools, token-saving options, and filters."""
+    return _USAGE_GUIDE
+
+
 # =============================================================================
 # CONTEXT ENGINEERING: Tool Discovery (Lazy Schema Loading)
 # =============================================================================
@@ -341,21 +475,170 @@ async def get_quickstart() -> str:
 # This reduces initial context from ~10-50k tokens to ~500 bytes.
 
 # Tool metadata for discovery (lightweight - just names and brief descriptions)
-_TOOL_CATALOG = {
-    "ready": "Find tasks ready to work on (no blockers)",
-    "list": "List issues with filters (status, priority, type)",
-    "show": "Show full details for a specific issue",
-    "create": "Create a new issue (bug, feature, task, epic)",
-    "update": "Update issue status, priority, or assignee",
-    "close": "Close or reopen issues (action='close' or 'reopen')",
-    "dep": "Manage dependencies (action='add', 'remove', or 'tree')",
-    "comment": "Manage comments (action='add' or 'list')",
-    "stats": "Get issue statistics",
-    "blocked": "Show blocked issues and what blocks them",
-    "context": "Manage workspace context (set, show, init)",
-    "admin": "Administrative/diagnostic operations",
-    "discover_tools": "List available tools (names only)",
-    "get_tool_info": "Get detailed info for a specific tool",
+# Read-only so a stray write can't corrupt later discover_tools() responses
+_TOOL_CATALOG = MappingProxyType({
+    "ready": "Find unblocked tasks",
+    "list": "List issues (filters)",
+    "show": "Show issue details",
+    "create": "Create an issue",
+    "update": "Update an issue",
+    "close": "Close or reopen issues",
+    "dep": "Add, remove, or tree dependencies",
+    "comment": "Add or list comments",
+    "stats": "Issue statistics",
+    "blocked": "List blocked issues",
+    "context": "Set, show, or init workspace",
+    "admin": "Diagnostics and maintenance",
+    "batch_execute": "Run several tool calls at once",
+    "poll_job": "Check a background admin job",
+    "discover_tools": "List tools",
+    "get_tool_info": "Tool parameters and usage",
+})
+
+
+# Per-tool details served by get_tool_info(), which prepends the catalog summary
+_TOOL_DETAILS: dict[str, dict[str, Any]] = {
+    "ready": {
+        "long_description": "Open issues with no open blockers, in minimal format",
+        "parameters": {
+            "limit": "int (1-100, default 10) - Max issues to return",
+            "priority": "int (0-4, optional) - Filter by priority",
+            "assignee": "str (optional) - Filter by assignee",
+            "workspace_root": "str (optional) - Workspace path"
+        },
+        "returns": "List of ready issues (minimal format for context efficiency)",
+        "example": "ready(limit=5, priority=1)"
+    },
+    "list": {
+        "long_description": "Filter by status, priority, type, or assignee",
+        "parameters": {
+            "status": "open|in_progress|blocked|closed (optional)",
+            "priority": "int 0-4 (optional)",
+            "issue_type": "bug|feature|task|epic|chore (optional)",
+            "assignee": "str (optional)",
+            "limit": "int (1-100, default 20)",
+            "workspace_root": "str (optional)"
+        },
+        "returns": "List of issues (compacted if >20 results)",
+        "example": "list(status='open', priority=1, limit=10)"
+    },
+    "show": {
+        "long_description": "Full issue including dependencies and dependents",
+        "parameters": {
+            "issue_id": "str (required) - e.g., 'bd-a1b2'",
+            "workspace_root": "str (optional)"
+        },
+        "returns": "Full Issue object with dependencies and dependents",
+        "example": "show(issue_id='bd-a1b2')"
+    },
+    "create": {
+        "long_description": "Types: bug, feature, task, epic, chore",
+        "parameters": {
+            "title": "str (required)",
+            "description": "str (default '')",
+            "priority": "int 0-4 (default 2)",
+            "issue_type": "bug|feature|task|epic|chore (default task)",
+            "assignee": "str (optional)",
+            "labels": "list[str] (optional)",
+            "deps": "list[str] (optional) - dependency IDs",
+            "brief": "bool (default true) - Return OperationResult instead of full Issue",
+            "workspace_root": "str (optional)"
+        },
+        "returns": "OperationResult {id, action} or full Issue if brief=False",
+        "example": "create(title='Fix auth bug', priority=1, issue_type='bug')"
+    },
+    "update": {
+        "long_description": "Change status, priority, assignee, title, or description",
+        "parameters": {
+            "issue_id": "str (required)",
+            "status": "open|in_progress|blocked|deferred|closed (optional)",
+            "priority": "int 0-4 (optional)",
+            "assignee": "str (optional)",
+            "title": "str (optional)",
+            "description": "str (optional)",
+            "brief": "bool (default true) - Return OperationResult instead of full Issue",
+            "workspace_root": "str (optional)"
+        },
+        "returns": "OperationResult {id, action} or full Issue if brief=False",
+        "example": "update(issue_id='bd-a1b2', status='in_progress')"
+    },
+    "close": {
+        "long_description": "action='close' (default) or 'reopen'",
+        "parameters": {
+            "issue_id": "str (required for close)",
+            "issue_ids": "list[str] (for reopen multiple)",
+            "action": "str (default 'close') - 'close' or 'reopen'",
+            "reason": "str (default 'Completed')",
+            "brief": "bool (default true) - Return OperationResult instead of full Issue",
+            "workspace_root": "str (optional)"
+        },
+        "returns": "OperationResult or full Issue if brief=False",
+        "example": "close(issue_id='bd-a1b2', reason='Fixed in PR #123')"
+    },
+    "dep": {
+        "long_description": "action='add', 'remove', or 'tree'",
+        "parameters": {
+            "action": "str (required) - 'add', 'remove', or 'tree'",
+            "issue_id": "str (required) - Issue that has the dependency",
+            "depends_on_id": "str (required for add/remove) - Issue it depends on",
+            "dep_type": "blocks|related|parent-child|discovered-from (default blocks)",
+            "max_depth": "int (default 3) - For tree action",
+            "reverse": "bool (default true) - For tree: show dependents vs dependencies",
+            "brief": "bool (default true) - Return minimal output",
+            "workspace_root": "str (optional)"
+        },
+        "returns": "OperationResult for add/remove, tree structure for tree",
+        "example": "dep(action='add', issue_id='bd-f1a2', depends_on_id='bd-a1b2')"
+    },
+    "stats": {
+        "long_description": "Counts and metrics for the workspace",
+        "parameters": {"workspace_root": "str (optional)"},
+        "returns": "Stats object with counts and metrics",
+        "example": "stats()"
+    },
+    "blocked": {
+        "long_description": "Each entry lists the issues blocking it",
+        "parameters": {"workspace_root": "str (optional)"},
+        "returns": "List of blocked issues with blocker info",
+        "example": "blocked()"
+    },
+    "batch_execute": {
+        "long_description": "Sub-calls share one workspace; results come back in call order",
+        "parameters": {
+            "calls": "list of {tool, args} - Sub-calls to ready/list/show/create/update/close/dep/comment/stats",
+            "max_concurrent": "int (default 1) - Sub-calls in flight at once",
+            "stop_on_error": "bool (default false) - Skip remaining calls after a failure",
+            "workspace_root": "str (optional)"
+        },
+        "returns": "List of {tool, ok, result|error}, one per call",
+        "example": (
+            "batch_execute(calls=[{'tool': 'show', 'args': {'issue_id': 'bd-a1b2'}}, "
+            "{'tool': 'stats', 'args': {}}], max_concurrent=2)"
+        )
+    },
+    "poll_job": {
+        "long_description": "Result of an admin(..., background=True) job once it has finished",
+        "parameters": {"job_id": "str - ID returned by admin(background=True)"},
+        "returns": "{job_id, done} plus result or error when done",
+        "example": "poll_job(job_id='3f2a...')"
+    },
+}
+
+
+def _static_result(payload: dict[str, Any]) -> ToolResult:
+    """Wrap a static payload as a ToolResult, serializing it once at import time."""
+    return ToolResult(structured_content=payload)
+
+
+_DISCOVER_RESULT = _static_result({
+    "tools": dict(_TOOL_CATALOG),
+    "count": len(_TOOL_CATALOG),
+    "hint": "Use get_tool_info('tool_name') for full parameters and usage"
+})
+_AVAILABLE_TOOLS: tuple[str, ...] = tuple(_TOOL_DETAILS)
+_TOOL_INFO_RESULTS = {
+    name: _static_result({"name": name, "summary": _TOOL_CATALOG[name], **details})
+    for name, details in _TOOL_DETAILS.items()
 }
 
 
@@ -363,7 +646,7 @@ _TOOL_CATALOG = {
     name="discover_tools",
     description="List available beads tools (names and brief descriptions only). Use get_tool_info() for full details.",
 )
-async def discover_tools() -> dict[str, Any]:
+async def discover_tools() -> ToolResult:
     """Discover available beads tools without loading full schemas.
     
     Returns lightweight tool catalog to minimize context usage.
@@ -371,18 +654,14 @@ async def discover_tools() -> dict[str, Any]:
     
     Context savings: ~500 bytes vs ~10-50k for full schemas.
     """
-    return {
-        "tools": _TOOL_CATALOG,
-        "count": len(_TOOL_CATALOG),
-        "hint": "Use get_tool_info('tool_name') for full parameters and usage"
-    }
+    return _DISCOVER_RESULT
 
 
 @mcp.tool(
     name="get_tool_info",
     description="Get detailed information about a specific beads tool including parameters.",
 )
-async def get_tool_info(tool_name: str) -> dict[str, Any]:
+async def get_tool_info(tool_name: str) -> ToolResult:
     """Get detailed info for a specific tool.
     
     Args:
@@ -391,229 +670,168 @@ async def get_tool_info(tool_name: str) -> dict[str, Any]:
     Returns:
         Full tool details including parameters and usage examples
     """
-    tool_details = {
-        "ready": {
-            "name": "ready",
-            "description": "Find tasks with no blockers, ready to work on",
-            "parameters": {
-                "limit": "int (1-100, default 10) - Max issues to return",
-                "priority": "int (0-4, optional) - Filter by priority",
-                "assignee": "str (optional) - Filter by assignee",
-                "workspace_root": "str (optional) - Workspace path"
-            },
-            "returns": "List of ready issues (minimal format for context efficiency)",
-            "example": "ready(limit=5, priority=1)"
-        },
-        "list": {
-            "name": "list",
-            "description": "List all issues with optional filters",
-            "parameters": {
-                "status": "open|in_progress|blocked|closed (optional)",
-                "priority": "int 0-4 (optional)",
-                "issue_type": "bug|feature|task|epic|chore (optional)",
-                "assignee": "str (optional)",
-                "limit": "int (1-100, default 20)",
-                "workspace_root": "str (optional)"
-            },
-            "returns": "List of issues (compacted if >20 results)",
-            "example": "list(status='open', priority=1, limit=10)"
-        },
-        "show": {
-            "name": "show",
-            "description": "Show full details for a specific issue including dependencies",
-            "parameters": {
-                "issue_id": "str (required) - e.g., 'bd-a1b2'",
-                "workspace_root": "str (optional)"
-            },
-            "returns": "Full Issue object with dependencies and dependents",
-            "example": "show(issue_id='bd-a1b2')"
-        },
-        "create": {
-            "name": "create",
-            "description": "Create a new issue",
-            "parameters": {
-                "title": "str (required)",
-                "description": "str (default '')",
-                "priority": "int 0-4 (default 2)",
-                "issue_type": "bug|feature|task|epic|chore (default task)",
-                "assignee": "str (optional)",
-                "labels": "list[str] (optional)",
-                "deps": "list[str] (optional) - dependency IDs",
-                "brief": "bool (default true) - Return OperationResult instead of full Issue",
-                "workspace_root": "str (optional)"
-            },
-            "returns": "OperationResult {id, action} or full Issue if brief=False",
-            "example": "create(title='Fix auth bug', priority=1, issue_type='bug')"
-        },
-        "update": {
-            "name": "update",
-            "description": "Update an existing issue",
-            "parameters": {
-                "issue_id": "str (required)",
-                "status": "open|in_progress|blocked|deferred|closed (optional)",
-                "priority": "int 0-4 (optional)",
-                "assignee": "str (optional)",
-                "title": "str (optional)",
-                "description": "str (optional)",
-                "brief": "bool (default true) - Return OperationResult instead of full Issue",
-                "workspace_root": "str (optional)"
-            },
-            "returns": "OperationResult {id, action} or full Issue if brief=False",
-            "example": "update(issue_id='bd-a1b2', status='in_progress')"
-        },
-        "close": {
-            "name": "close",
-            "description": "Close or reopen issues (action='close' or 'reopen')",
-            "parameters": {
-                "issue_id": "str (required for close)",
-                "issue_ids": "list[str] (for reopen multiple)",
-                "action": "str (default 'close') - 'close' or 'reopen'",
-                "reason": "str (default 'Completed')",
-                "brief": "bool (default true) - Return OperationResult instead of full Issue",
-                "workspace_root": "str (optional)"
-            },
-            "returns": "OperationResult or full Issue if brief=False",
-            "example": "close(issue_id='bd-a1b2', reason='Fixed in PR #123')"
-        },
-        "dep": {
-            "name": "dep",
-            "description": "Manage dependencies (action='add', 'remove', or 'tree')",
-            "parameters": {
-                "action": "str (required) - 'add', 'remove', or 'tree'",
-                "issue_id": "str (required) - Issue that has the dependency",
-                "depends_on_id": "str (required for add/remove) - Issue it depends on",
-                "dep_type": "blocks|related|parent-child|discovered-from (default blocks)",
-                "max_depth": "int (default 3) - For tree action",
-                "reverse": "bool (default true) - For tree: show dependents vs dependencies",
-                "brief": "bool (default true) - Return minimal output",
-                "workspace_root": "str (optional)"
-            },
-            "returns": "OperationResult for add/remove, tree structure for tree",
-            "example": "dep(action='add', issue_id='bd-f1a2', depends_on_id='bd-a1b2')"
-        },
-        "stats": {
-            "name": "stats",
-            "description": "Get issue statistics",
-            "parameters": {"workspace_root": "str (optional)"},
-            "returns": "Stats object with counts and metrics",
-            "example": "stats()"
-        },
-        "blocked": {
-            "name": "blocked",
-            "description": "Show blocked issues and what blocks them",
-            "parameters": {"workspace_root": "str (optional)"},
-            "returns": "List of blocked issues with blocker info",
-            "example": "blocked()"
-        },
-    }
+    if PROGRESSIVE_TOOLS:
+        _load_tool(tool_name)
+
+    result = _TOOL_INFO_RESULTS.get(tool_name)
+    if result is None:
+        return ToolResult(structured_content={
+            "error": f"Unknown tool: {tool_name}",
+            "available_tools": _AVAILABLE_TOOLS,
+            "hint": "Use discover_tools() to see all available tools"
+        })
+    return result
+
+
+def _load_tool(tool_name: str) -> bool:
+    """Enable a progressively loaded tool. Returns False if the name is unknown."""
+    tool = _LAZY_TOOLS.get(tool_name)
+    if tool is None:
+        return False
+    if not tool.enabled:
+        tool.enable()  # Notifies the client that the tool list changed
+    return True
+
+
+@mcp.tool(
+    name="load_tool",
+    description="Load a beads tool so it can be called (progressive mode). Use discover_tools() to see names.",
+    enabled=PROGRESSIVE_TOOLS,
+)
+async def load_tool(tool_name: str) -> dict[str, Any]:
+    """Enable a tool that was held back by BEADS_MCP_PROGRESSIVE=1.
     
-    if tool_name not in tool_details:
-        available = list(tool_details.keys())
+    Args:
+        tool_name: Name of the tool to load
+        
+    Returns:
+        Confirmation, or an error listing loadable tools
+    """
+    if not _load_tool(tool_name):
         return {
             "error": f"Unknown tool: {tool_name}",
-            "available_tools": available,
+            "available_tools": list(_LAZY_TOOLS),
             "hint": "Use discover_tools() to see all available tools"
         }
-    
-    return tool_details[tool_name]
+    return {"loaded": tool_name}
 
 
 # Context management tools
-@mcp.tool(
-    name="context",
-    description="""Manage workspace context.
-Actions:
-- set: Set workspace root directory (required before write operations)
-- show: Show current workspace context and database path
-- init: Initialize new beads database (creates .beads/ directory)""",
+
+# Response templates for context(); formatted per call
+_CONTEXT_SET_TEMPLATE = "Context set successfully:\n  Workspace root: {root}\n  Database: {db}"
+_DB_NOT_FOUND = "Not found (run context(action='init') to create)"
+_CONTEXT_TIMEOUT_TEMPLATE = (
+    "Error: Git repository detection timed out.\n"
+    "  Provided path: {path}\n"
+    "  This may indicate a slow filesystem or git configuration issue."
+)
+_CONTEXT_SHOW_TEMPLATE = "Workspace root: {root}\nDatabase: {db}\nActor: {actor}"
+_CONTEXT_NOT_SET_TEMPLATE = (
+    "Context not set. Call context(action='set', workspace_root='...') first.\n"
+    "Current process CWD: {cwd}\n"
+    "BEADS_WORKING_DIR: {working_dir}\n"
+    "BEADS_DB: {db}"
 )
-async def context(
-    action: str,  # "set", "show", "init"
-    workspace_root: str | None = None,
-    prefix: str | None = None,
-) -> str:
-    """Manage workspace context."""
 
-    if action == "set":
-        if not workspace_root:
-            raise ValueError("workspace_root required for set action")
 
-        # Resolve to git repo root if possible
-        try:
-            resolved_root = await asyncio.wait_for(
-                asyncio.to_thread(_resolve_workspace_root, workspace_root),
-                timeout=5.0,
-            )
-        except asyncio.TimeoutError:
-            logger.error(f"Git detection timed out after 5s for: {workspace_root}")
-            return (
-                f"Error: Git repository detection timed out.\n"
-                f"  Provided path: {workspace_root}\n"
-                f"  This may indicate a slow filesystem or git configuration issue."
-            )
+def _locate_workspace(path: str) -> tuple[str, str | None]:
+    """Resolve path to its workspace root and find that root's beads database."""
+    root = _resolve_workspace_root(path)
+    return root, _find_beads_db(root)
 
-        # Store in persistent context
-        _workspace_context["BEADS_WORKING_DIR"] = resolved_root
-        _workspace_context["BEADS_CONTEXT_SET"] = "1"
-        os.environ["BEADS_WORKING_DIR"] = resolved_root
-        os.environ["BEADS_CONTEXT_SET"] = "1"
-
-        # Find beads database
-        db_path = _find_beads_db(resolved_root)
-
-        if db_path is None:
-            _workspace_context.pop("BEADS_DB", None)
-            os.environ.pop("BEADS_DB", None)
-            return (
-                f"Context set successfully:\n"
-                f"  Workspace root: {resolved_root}\n"
-                f"  Database: Not found (run context(action='init') to create)"
-            )
 
-        _workspace_context["BEADS_DB"] = db_path
-        os.environ["BEADS_DB"] = db_path
+async def _context_set(workspace_root: str | None, prefix: str | None) -> str:
+    """Resolve workspace_root and store it as the persistent workspace context."""
+    if not workspace_root:
+        raise ValueError("workspace_root required for set action")
 
-        return (
-            f"Context set successfully:\n"
-            f"  Workspace root: {resolved_root}\n"
-            f"  Database: {db_path}"
-        )
+    # Resolve to git repo root if possible and find its database in one worker
+    # thread, so neither the git lookup nor the directory walk blocks the loop.
+    # The git timeout is enforced by subprocess.run, which kills the child.
+    try:
+        resolved_root, db_path = await asyncio.to_thread(_locate_workspace, os.path.abspath(workspace_root))
+    except subprocess.TimeoutExpired:
+        logger.error(f"Git detection timed out after {_GIT_TIMEOUT:g}s for: {workspace_root}")
+        return _CONTEXT_TIMEOUT_TEMPLATE.format(path=workspace_root)
 
-    elif action == "show":
-        context_set = (
-            _workspace_context.get("BEADS_CONTEXT_SET")
-            or os.environ.get("BEADS_CONTEXT_SET")
-        )
+    global _workspace_context
 
-        if not context_set:
-            return (
-                "Context not set. Call context(action='set', workspace_root='...') first.\n"
-                f"Current process CWD: {os.getcwd()}\n"
-                f"BEADS_WORKING_DIR: {_workspace_context.get('BEADS_WORKING_DIR', 'NOT SET')}\n"
-                f"BEADS_DB: {_workspace_context.get('BEADS_DB') or os.environ.get('BEADS_DB', 'NOT SET')}"
-            )
+    # Store in persistent context. Tools pick the workspace up through
+    # tool_entry, and bd subprocesses discover the database from their cwd,
+    # so nothing is mirrored into os.environ.
+    _workspace_context = _WorkspaceContext(resolved_root, db_path, True)
 
-        working_dir = (
-            _workspace_context.get("BEADS_WORKING_DIR")
-            or os.environ.get("BEADS_WORKING_DIR", "NOT SET")
-        )
-        db_path = (
-            _workspace_context.get("BEADS_DB")
-            or os.environ.get("BEADS_DB", "NOT SET")
-        )
-        actor = os.environ.get("BEADS_ACTOR", "NOT SET")
+    return _CONTEXT_SET_TEMPLATE.format(root=resolved_root, db=db_path or _DB_NOT_FOUND)
+
+
+async def _context_show(workspace_root: str | None, prefix: str | None) -> str:
+    """Describe the current workspace context and database path."""
+    global _show_cache
 
-        return (
-            f"Workspace root: {working_dir}\n"
-            f"Database: {db_path}\n"
-            f"Actor: {actor}"
+    workspace = _workspace_context
+    if not workspace.context_set:
+        return _CONTEXT_NOT_SET_TEMPLATE.format(
+            cwd=os.getcwd(),
+            working_dir=workspace.working_dir or "NOT SET",
+            db=workspace.db or os.environ.get("BEADS_DB", "NOT SET"),
         )
 
-    elif action == "init":
+    # Only the context-set view is cached; the not-set view reports live CWD/env
+    env = os.environ
+    key = (workspace, env.get("BEADS_WORKING_DIR"), env.get("BEADS_DB"), env.get("BEADS_ACTOR"))
+    if _show_cache is not None and _show_cache[0] == key:
+        return _show_cache[1]
+
+    text = _CONTEXT_SHOW_TEMPLATE.format(
+        root=workspace.working_dir or key[1] or "NOT SET",
+        db=workspace.db or key[2] or "NOT SET",
+        actor=key[3] or "NOT SET",
+    )
+    _show_cache = (key, text)
+    return text
+
+
+async def _context_init(workspace_root: str | None, prefix: str | None) -> str:
+    """Initialize a new beads database in the current workspace."""
+    # A new database (and possibly a new repo) may shadow cached lookups
+    _db_cache.clear()
+    _invalidate_stats()
+    _resolve_workspace_root.cache_clear()
+
+    # context() is not wrapped in tool_entry; route init to the set workspace
+    token = current_workspace.set(_workspace_context.working_dir)
+    try:
         return await beads_init(prefix=prefix)
+    finally:
+        current_workspace.reset(token)
+
+
+_CONTEXT_ACTIONS: dict[str, Callable[[str | None, str | None], Awaitable[str]]] = {
+    "set": _context_set,
+    "show": _context_show,
+    "init": _context_init,
+}
+
 
-    else:
+@mcp.tool(
+    name="context",
+    description="""Manage workspace context.
+Actions:
+- set: Set workspace root directory (required before write operations)
+- show: Show current workspace context and database path
+- init: Initialize new beads database (creates .beads/ directory)""",
+)
+async def context(
+    action: str,  # "set", "show", "init"
+    workspace_root: str | None = None,
+    prefix: str | None = None,
+) -> str:
+    """Manage workspace context."""
+    handler = _CONTEXT_ACTIONS.get(action)
+    if handler is None:
         raise ValueError(f"Unknown action: {action}. Use 'set', 'show', or 'init'")
+    return await handler(workspace_root, prefix)
 
 
 # Register all tools
@@ -636,8 +854,109 @@ def _to_minimal(issue: Issue) -> IssueMinimal:
     )
 
 
+def _to_brief(issue: Issue) -> BriefIssue:
+    """Convert full Issue to BriefIssue for scanning."""
+    return BriefIssue(
+        id=issue.id,
+        title=issue.title,
+        status=issue.status,
+        priority=issue.priority,
+    )
+
+
+# List projections validate in one pydantic-core call, reading attributes
+# straight off the Issue/LinkedIssue models instead of one constructor per item.
+_BRIEF_ISSUE_LIST: Final[TypeAdapter[list[BriefIssue]]] = TypeAdapter(list[BriefIssue])
+_BRIEF_DEP_LIST: Final[TypeAdapter[list[BriefDep]]] = TypeAdapter(list[BriefDep])
+_BRIEF_TREE_NODE_LIST: Final[TypeAdapter[list[BriefTreeNode]]] = TypeAdapter(list[BriefTreeNode])
+
+
+def _to_brief_list(issues: list[Issue]) -> list[BriefIssue]:
+    """Convert a list of full Issues to BriefIssues."""
+    return _BRIEF_ISSUE_LIST.validate_python(issues, from_attributes=True)
+
+
+def _to_brief_deps(deps: list[LinkedIssue]) -> list[BriefDep]:
+    """Convert dependency/dependent LinkedIssues to BriefDeps."""
+    return _BRIEF_DEP_LIST.validate_python(deps, from_attributes=True)
+
+
+def _op_result(issue_id: str, action: OperationAction, message: str | None = None) -> OperationResult:
+    """Build the brief confirmation returned by write tools."""
+    return OperationResult(id=issue_id, action=action, message=message)
+
+
+def _invalidate_stats() -> None:
+    """Drop cached stats() results after a write."""
+    global _stats_generation
+    _stats_generation += 1
+    _stats_cache.clear()
+
+
+# Projectable names for the fields= output mode
+_ISSUE_FIELDS: Final[frozenset[str]] = frozenset(Issue.model_fields)
+_DEP_FIELDS: Final[frozenset[str]] = frozenset({"dependencies", "dependents"})
+
+
+def _check_fields(fields: list[str]) -> list[str]:
+    """Validate a fields= projection once per request, before touching any issue.
+
+    Raises:
+        ValueError: If any requested name is not an Issue field
+    """
+    invalid = [k for k in fields if k not in _ISSUE_FIELDS]
+    if invalid:
+        raise ValueError(
+            f"Invalid field(s): {', '.join(invalid)}. Valid fields: {', '.join(sorted(_ISSUE_FIELDS))}"
+        )
+    return fields
+
+
+def _truncate(text: str, limit: int | None) -> str:
+    """Cut text to limit characters plus an ellipsis; no-op when limit is unset."""
+    if not text or not limit or len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+def _shape_issues(
+    issues: list[Issue],
+    brief: bool,
+    fields: list[str] | None,
+    max_description_length: int | None,
+) -> list[Issue] | list[BriefIssue] | list[dict[str, Any]]:
+    """Apply ready()/list() output control in a single pass over issues.
+
+    brief and fields build their output directly and never touch the Issue
+    objects; only the default shape mutates descriptions in place.
+    """
+    if brief:
+        return _to_brief_list(issues)
+
+    if fields:
+        _check_fields(fields)
+        # Fields are validated against Issue.model_fields, so read the instance
+        # __dict__ directly instead of going through attribute lookup per field
+        if max_description_length and "description" in fields:
+            # Truncate while projecting rather than in a second pass
+            return [
+                {
+                    k: _truncate(d[k], max_description_length) if k == "description" else d[k]
+                    for k in fields
+                }
+                for d in (i.__dict__ for i in issues)
+            ]
+        return [{k: d[k] for k in fields} for d in (i.__dict__ for i in issues)]
+
+    if max_description_length:
+        for issue in issues:
+            issue.description = _truncate(issue.description, max_description_length)
+
+    return issues
+
+
 @mcp.tool(name="ready", description="Find tasks that have no blockers and are ready to be worked on. Returns minimal format for context efficiency.")
-@with_workspace
+@tool_entry()
 async def ready_work(
     limit: int = 10,
     priority: int | None = None,
@@ -664,26 +983,14 @@ async def ready_work(
         sort_policy=sort_policy,
     )
 
-    # Apply output control
-    if brief:
-        return [BriefIssue(id=i.id, title=i.title, status=i.status) for i in issues]
-
-    if fields:
-        return [{k: getattr(i, k, None) for k in fields if hasattr(i, k)} for i in issues]
-
-    if max_description_length:
-        for issue in issues:
-            if issue.description and len(issue.description) > max_description_length:
-                issue.description = issue.description[:max_description_length] + "..."
-
-    return issues
+    return _shape_issues(issues, brief, fields, max_description_length)
 
 
 @mcp.tool(
     name="list",
     description="""List all issues with optional filters. When status='blocked', returns BlockedIssue with blocked_by info.""",
 )
-@with_workspace
+@tool_entry()
 async def list_issues(
     status: IssueStatus | None = None,
     priority: int | None = None,
@@ -713,27 +1020,12 @@ async def list_issues(
         labels_any=labels_any,
         query=query,
         unassigned=unassigned,
+        # Leave dependencies/dependents empty to reduce payload size
+        # Use show() for full details
+        include_dependencies=False,
     )
 
-    # Strip dependencies/dependents to reduce payload size
-    # Use show() for full details
-    for issue in issues:
-        issue.dependencies = []
-        issue.dependents = []
-
-    # Apply output control
-    if brief:
-        return [BriefIssue(id=i.id, title=i.title, status=i.status) for i in issues]
-
-    if fields:
-        return [{k: getattr(i, k, None) for k in fields if hasattr(i, k)} for i in issues]
-
-    if max_description_length:
-        for issue in issues:
-            if issue.description and len(issue.description) > max_description_length:
-                issue.description = issue.description[:max_description_length] + "..."
-
-    return issues
+    return _shape_issues(issues, brief, fields, max_description_length)
 
 
 @mcp.tool(
@@ -746,7 +1038,7 @@ Output modes:
 - brief_deps=True: Full issue but deps as {id, title, status, dependency_type}
 - fields=["id", "dependencies"]: Only specified fields""",
 )
-@with_workspace
+@tool_entry()
 async def show_issue(
     issue_id: str,
     # Output control
@@ -761,48 +1053,30 @@ async def show_issue(
 
     # Apply output control
     if brief:
-        return BriefIssue(id=issue.id, title=issue.title, status=issue.status)
+        return _to_brief(issue)
 
     if fields:
-        result = {k: getattr(issue, k, None) for k in fields if hasattr(issue, k)}
-        # Apply brief_deps to fields output if dependencies/dependents requested
-        if brief_deps:
-            if "dependencies" in result and result["dependencies"]:
-                result["dependencies"] = [
-                    BriefDep(
-                        id=d.id, title=d.title, status=d.status,
-                        dependency_type=getattr(d, "dependency_type", None)
-                    ) for d in result["dependencies"]
-                ]
-            if "dependents" in result and result["dependents"]:
-                result["dependents"] = [
-                    BriefDep(
-                        id=d.id, title=d.title, status=d.status,
-                        dependency_type=getattr(d, "dependency_type", None)
-                    ) for d in result["dependents"]
-                ]
+        # Build each requested field once; deps go straight to BriefDep when brief_deps is set
+        values = issue.__dict__
+        result: dict[str, Any] = {}
+        for k in _check_fields(fields):
+            if brief_deps and k in _DEP_FIELDS:
+                result[k] = _to_brief_deps(values[k])
+            elif k == "description":
+                result[k] = _truncate(values[k], max_description_length)
+            else:
+                result[k] = values[k]
         return result
 
     if max_description_length:
-        if issue.description and len(issue.description) > max_description_length:
-            issue.description = issue.description[:max_description_length] + "..."
+        issue.description = _truncate(issue.description, max_description_length)
 
     # Convert deps to brief format if requested
     if brief_deps:
-        # Convert to dict so we can modify deps
-        issue_dict = issue.model_dump()
-        if issue_dict.get("dependencies"):
-            issue_dict["dependencies"] = [
-                {"id": d["id"], "title": d["title"], "status": d["status"],
-                 "dependency_type": d.get("dependency_type")}
-                for d in issue_dict["dependencies"]
-            ]
-        if issue_dict.get("dependents"):
-            issue_dict["dependents"] = [
-                {"id": d["id"], "title": d["title"], "status": d["status"],
-                 "dependency_type": d.get("dependency_type")}
-                for d in issue_dict["dependents"]
-            ]
+        # Shallow field copy: only the dep lists are rebuilt, the issue body is shared
+        issue_dict = dict(issue)
+        issue_dict["dependencies"] = _to_brief_deps(issue.dependencies)
+        issue_dict["dependents"] = _to_brief_deps(issue.dependents)
         return issue_dict
 
     return issue
@@ -813,8 +1087,7 @@ async def show_issue(
     description="""Create a new issue (bug, feature, task, epic, or chore) with optional design,
 acceptance criteria, and dependencies. Returns brief confirmation by default; use brief=False for full Issue.""",
 )
-@with_workspace
-@require_context
+@tool_entry(require_context=True)
 async def create_issue(
     title: str,
     description: str = "",
@@ -848,9 +1121,10 @@ async def create_issue(
         id=id,
         deps=deps,
     )
+    _invalidate_stats()
     if not brief:
         return issue
-    return OperationResult(id=issue.id, action="created")
+    return _op_result(issue.id, "created")
 
 
 @mcp.tool(
@@ -859,8 +1133,7 @@ async def create_issue(
 acceptance criteria, labels, or time estimate. Use this to claim work (set status=in_progress).
 Returns brief confirmation by default; use brief=False for full Issue.""",
 )
-@with_workspace
-@require_context
+@tool_entry(require_context=True)
 async def update_issue(
     issue_id: str,
     status: IssueStatus | None = None,
@@ -889,8 +1162,9 @@ async def update_issue(
     # If trying to close via update, redirect to close_issue to preserve approval workflow
     if status == "closed":
         issues = await beads_close_issue(issue_id=issue_id, reason="Closed via update")
+        _invalidate_stats()
         if brief:
-            return OperationResult(id=issue_id, action="closed")
+            return _op_result(issue_id, "closed")
         return issues[0] if issues else None
 
     issue = await beads_update_issue(
@@ -908,9 +1182,47 @@ async def update_issue(
         remove_labels=remove_labels,
         estimated_minutes=estimated_minutes,
     )
+    _invalidate_stats()
     if not brief:
         return issue
-    return OperationResult(id=issue_id, action="updated")
+    return _op_result(issue_id, "updated")
+
+
+async def _close(
+    issue_id: str | None, issue_ids: list[str] | None, reason: str, brief: bool
+) -> Any:
+    """Close a single issue."""
+    if not issue_id:
+        raise ValueError("issue_id required for close action")
+
+    issues = await beads_close_issue(issue_id=issue_id, reason=reason)
+    _invalidate_stats()
+
+    if not brief:
+        return issues
+
+    return _op_result(issue_id, "closed", reason)
+
+
+async def _reopen(
+    issue_id: str | None, issue_ids: list[str] | None, reason: str, brief: bool
+) -> Any:
+    """Reopen one or more closed issues."""
+    ids_to_reopen = issue_ids or ([issue_id] if issue_id else [])
+    if not ids_to_reopen:
+        raise ValueError("issue_id or issue_ids required for reopen action")
+    issues = await beads_reopen_issue(issue_ids=ids_to_reopen, reason=reason if reason != "Completed" else None)
+    _invalidate_stats()
+    if not brief:
+        return issues
+    ids_str = ", ".join(ids_to_reopen)
+    return _op_result(ids_str, "reopened", f"{len(issues)} issue(s)")
+
+
+_CLOSE_ACTIONS: dict[str, Callable[[str | None, list[str] | None, str, bool], Awaitable[Any]]] = {
+    "close": _close,
+    "reopen": _reopen,
+}
 
 
 @mcp.tool(
@@ -920,8 +1232,7 @@ async def update_issue(
 - action="reopen": Reopen closed issues (use issue_ids for multiple).
 Returns brief confirmation by default; use brief=False for full Issue.""",
 )
-@with_workspace
-@require_context
+@tool_entry(require_context=True)
 async def close_issue(
     issue_id: str | None = None,
     issue_ids: list[str] | None = None,
@@ -935,29 +1246,77 @@ async def close_issue(
     Args:
         brief: If True (default), return minimal OperationResult; if False, return full Issues
     """
+    handler = _CLOSE_ACTIONS.get(action)
+    if handler is None:
+        raise ValueError(f"Unknown action: {action}. Use 'close' or 'reopen'")
+    return await handler(issue_id, issue_ids, reason, brief)
+
+
+async def _dep_add(
+    issue_id: str, depends_on_id: str | None, dep_type: DependencyType,
+    max_depth: int, reverse: bool, brief: bool,
+) -> Any:
+    """Add a dependency: issue_id depends on depends_on_id."""
+    if not depends_on_id:
+        raise ValueError("depends_on_id required for add action")
+    result = await beads_add_dependency(
+        issue_id=issue_id,
+        depends_on_id=depends_on_id,
+        dep_type=dep_type,
+    )
+    _invalidate_stats()  # Blocked/ready counts depend on dependencies
+    if not brief:
+        return result
+    return _op_result(f"{issue_id}->{depends_on_id}", "dep_added")
 
-    # Handle reopen action
-    if action == "reopen":
-        ids_to_reopen = issue_ids or ([issue_id] if issue_id else [])
-        if not ids_to_reopen:
-            raise ValueError("issue_id or issue_ids required for reopen action")
-        issues = await beads_reopen_issue(issue_ids=ids_to_reopen, reason=reason if reason != "Completed" else None)
-        if not brief:
-            return issues
-        ids_str = ", ".join(ids_to_reopen)
-        return OperationResult(id=ids_str, action="reopened", message=f"{len(issues)} issue(s)")
-
-    # Handle close action (default)
-    if not issue_id:
-        raise ValueError("issue_id required for close action")
 
-    # Close the issue
-    issues = await beads_close_issue(issue_id=issue_id, reason=reason)
+async def _dep_remove(
+    issue_id: str, depends_on_id: str | None, dep_type: DependencyType,
+    max_depth: int, reverse: bool, brief: bool,
+) -> Any:
+    """Remove a dependency between two issues.
 
+    The tool's default dep_type ("blocks") means "whatever type links them",
+    so it is sent to the backend as None.
+    """
+    if not depends_on_id:
+        raise ValueError("depends_on_id required for remove action")
+    normalized_type = None if dep_type == "blocks" else dep_type
+    result = await beads_remove_dependency(
+        issue_id=issue_id,
+        depends_on_id=depends_on_id,
+        dep_type=normalized_type,
+    )
+    _invalidate_stats()
     if not brief:
-        return issues
+        return result
+    return _op_result(f"{issue_id}->{depends_on_id}", "dep_removed")
+
 
-    return OperationResult(id=issue_id, action="closed", message=reason)
+async def _dep_tree(
+    issue_id: str, depends_on_id: str | None, dep_type: DependencyType,
+    max_depth: int, reverse: bool, brief: bool,
+) -> Any:
+    """Show the dependency tree rooted at issue_id."""
+    result = await beads_dep_tree(
+        issue_id=issue_id,
+        max_depth=max_depth,
+        reverse=reverse,
+    )
+    if brief:
+        # Convert to minimal format. Nodes are raw bd output, validated in one
+        # call; keys BriefTreeNode doesn't declare are ignored.
+        return _BRIEF_TREE_NODE_LIST.validate_python(result.get("nodes") or [])
+    return result
+
+
+_DEP_ACTIONS: dict[
+    str, Callable[[str, str | None, DependencyType, int, bool, bool], Awaitable[Any]]
+] = {
+    "add": _dep_add,
+    "remove": _dep_remove,
+    "tree": _dep_tree,
+}
 
 
 @mcp.tool(
@@ -972,7 +1331,7 @@ Examples:
 - dep(action="add", issue_id="bd-1", depends_on_id="bd-2")
 - dep(action="tree", issue_id="bd-1", brief=True)""",
 )
-@with_workspace
+@tool_entry()
 async def dep(
     action: str,  # "add", "remove", "tree"
     issue_id: str,
@@ -988,54 +1347,31 @@ async def dep(
     Args:
         brief: If True (default), return minimal OperationResult for add/remove, or BriefTreeNode for tree
     """
+    handler = _DEP_ACTIONS.get(action)
+    if handler is None:
+        raise ValueError(f"Unknown action: {action}. Use 'add', 'remove', or 'tree'")
+    return await handler(issue_id, depends_on_id, dep_type, max_depth, reverse, brief)
 
-    if action == "add":
-        if not depends_on_id:
-            raise ValueError("depends_on_id required for add action")
-        result = await beads_add_dependency(
-            issue_id=issue_id,
-            depends_on_id=depends_on_id,
-            dep_type=dep_type,
-        )
-        if not brief:
-            return result
-        return OperationResult(id=f"{issue_id}->{depends_on_id}", action="dep_added")
-
-    elif action == "remove":
-        if not depends_on_id:
-            raise ValueError("depends_on_id required for remove action")
-        result = await beads_remove_dependency(
-            issue_id=issue_id,
-            depends_on_id=depends_on_id,
-            dep_type=dep_type if dep_type != "blocks" else None,
-        )
-        if not brief:
-            return result
-        return OperationResult(id=f"{issue_id}->{depends_on_id}", action="dep_removed")
-
-    elif action == "tree":
-        result = await beads_dep_tree(
-            issue_id=issue_id,
-            max_depth=max_depth,
-            reverse=reverse,
-        )
-        if brief:
-            # Convert to minimal format
-            nodes = result.get("nodes", [])
-            return [
-                BriefTreeNode(
-                    id=n["id"],
-                    title=n["title"],
-                    status=n["status"],
-                    depth=n.get("depth", 0),
-                    truncated=n.get("truncated", False),
-                )
-                for n in nodes
-            ]
+
+async def _comment_add(issue_id: str, text: str | None, author: str | None, brief: bool) -> Any:
+    """Add a comment to an issue."""
+    if not text:
+        raise ValueError("text required for add action")
+    result = await beads_comment_add(issue_id=issue_id, text=text, author=author)
+    if not brief:
         return result
+    return _op_result(issue_id, "comment_added")
 
-    else:
-        raise ValueError(f"Unknown action: {action}. Use 'add', 'remove', or 'tree'")
+
+async def _comment_list(issue_id: str, text: str | None, author: str | None, brief: bool) -> Any:
+    """List the comments on an issue."""
+    return await beads_comment_list(issue_id=issue_id)
+
+
+_COMMENT_ACTIONS: dict[str, Callable[[str, str | None, str | None, bool], Awaitable[Any]]] = {
+    "add": _comment_add,
+    "list": _comment_list,
+}
 
 
 @mcp.tool(
@@ -1045,7 +1381,7 @@ Actions:
 - add: Add a comment (requires text parameter)
 - list: List all comments on an issue""",
 )
-@with_workspace
+@tool_entry()
 async def comment(
     action: str,  # "add" or "list"
     issue_id: str,
@@ -1059,30 +1395,89 @@ async def comment(
     Args:
         brief: If True (default), return minimal OperationResult for add; if False, return full result
     """
-
-    if action == "add":
-        if not text:
-            raise ValueError("text required for add action")
-        result = await beads_comment_add(issue_id=issue_id, text=text, author=author)
-        if not brief:
-            return result
-        return OperationResult(id=issue_id, action="comment_added")
-
-    elif action == "list":
-        return await beads_comment_list(issue_id=issue_id)
-
-    else:
+    handler = _COMMENT_ACTIONS.get(action)
+    if handler is None:
         raise ValueError(f"Unknown action: {action}. Use 'add' or 'list'")
+    return await handler(issue_id, text, author, brief)
 
 
 @mcp.tool(
     name="stats",
     description="Get statistics: total issues, open, in_progress, closed, blocked, ready, and average lead time.",
 )
-@with_workspace
+@tool_entry()
 async def stats(workspace_root: str | None = None):
-    """Get statistics about tasks."""
-    return await beads_stats()
+    """Get statistics about tasks.
+
+    Results are reused for _STATS_TTL seconds per workspace so polling agents
+    don't recompute the aggregates; write tools drop the cache.
+    """
+    workspace = current_workspace.get()
+    cached = _stats_cache.get(workspace)
+    if cached is not None and time.monotonic() - cached[0] < _STATS_TTL:
+        return cached[1]
+
+    generation = _stats_generation
+    result = await beads_stats()
+    if generation == _stats_generation:
+        _stats_cache[workspace] = (time.monotonic(), result)
+    return result
+
+
+async def _admin_validate(checks: str | None, fix_all: bool, fix: bool, clean: bool) -> Any:
+    """Run database health checks."""
+    return await beads_validate(checks=checks, fix_all=fix_all)
+
+
+async def _admin_repair(checks: str | None, fix_all: bool, fix: bool, clean: bool) -> Any:
+    """Find (and with fix=True, repair) orphaned dependency references."""
+    result = await beads_repair_deps(fix=fix)
+    if fix:
+        _invalidate_stats()
+    return result
+
+
+async def _admin_schema(checks: str | None, fix_all: bool, fix: bool, clean: bool) -> Any:
+    """Show database schema info."""
+    return await beads_get_schema_info()
+
+
+async def _admin_debug(checks: str | None, fix_all: bool, fix: bool, clean: bool) -> str:
+    """Report working directory and environment info."""
+    env = os.environ.get
+    return (
+        "=== Working Directory Debug Info ===\n"
+        f"os.getcwd(): {os.getcwd()}\n"
+        f"Workspace context: {_workspace_context.working_dir or 'NOT SET'}\n"
+        f"Context database: {_workspace_context.db or 'NOT SET'}\n"
+        f"PWD env var: {env('PWD', 'NOT SET')}\n"
+        f"BEADS_PATH env var: {env('BEADS_PATH', 'NOT SET')}\n"
+        f"HOME: {env('HOME', 'NOT SET')}\n"
+        f"USER: {env('USER', 'NOT SET')}\n"
+    )
+
+
+async def _admin_migration(checks: str | None, fix_all: bool, fix: bool, clean: bool) -> Any:
+    """Get migration plan and database state."""
+    return await beads_inspect_migration()
+
+
+async def _admin_pollution(checks: str | None, fix_all: bool, fix: bool, clean: bool) -> Any:
+    """Detect (and with clean=True, delete) test issues."""
+    result = await beads_detect_pollution(clean=clean)
+    if clean:
+        _invalidate_stats()
+    return result
+
+
+_ADMIN_ACTIONS: dict[str, Callable[[str | None, bool, bool, bool], Coroutine[Any, Any, Any]]] = {
+    "validate": _admin_validate,
+    "repair": _admin_repair,
+    "schema": _admin_schema,
+    "debug": _admin_debug,
+    "migration": _admin_migration,
+    "pollution": _admin_pollution,
+}
 
 
 @mcp.tool(
@@ -1094,58 +1489,226 @@ Actions:
 - schema: Show database schema info
 - debug: Show environment and working directory info
 - migration: Get migration plan and database state
-- pollution: Detect/clean test issues (clean=True to delete)""",
+- pollution: Detect/clean test issues (clean=True to delete)
+background=True returns {"job_id"} immediately; fetch the result with poll_job(job_id).
+Use it for full-database scans (validate, repair, migration, pollution) on large databases.""",
 )
-@with_workspace
+@tool_entry()
 async def admin(
     action: str,  # validate, repair, schema, debug, migration, pollution
     checks: str | None = None,
     fix_all: bool = False,
     fix: bool = False,
     clean: bool = False,
+    background: bool = False,
     workspace_root: str | None = None,
 ):
     """Administrative and diagnostic operations."""
+    handler = _ADMIN_ACTIONS.get(action)
+    if handler is None:
+        raise ValueError(f"Unknown action: {action}. Use 'validate', 'repair', 'schema', 'debug', 'migration', or 'pollution'")
+    if background:
+        # The task inherits this call's context, so it stays on the same workspace
+        _prune_jobs()
+        job_id = uuid.uuid4().hex
+        task = asyncio.create_task(handler(checks, fix_all, fix, clean))
+        task.add_done_callback(partial(_job_done, job_id))
+        _jobs[job_id] = task
+        return {"job_id": job_id, "action": action}
+    return await handler(checks, fix_all, fix, clean)
 
-    if action == "validate":
-        return await beads_validate(checks=checks, fix_all=fix_all)
 
-    elif action == "repair":
-        return await beads_repair_deps(fix=fix)
+def _job_done(job_id: str, _task: "asyncio.Task[Any]") -> None:
+    """Record when a background job finished so _prune_jobs can expire it."""
+    _job_finished[job_id] = time.monotonic()
 
-    elif action == "schema":
-        return await beads_get_schema_info()
 
-    elif action == "debug":
-        info = []
-        info.append("=== Working Directory Debug Info ===\n")
-        info.append(f"os.getcwd(): {os.getcwd()}\n")
-        info.append(f"PWD env var: {os.environ.get('PWD', 'NOT SET')}\n")
-        info.append(f"BEADS_WORKING_DIR env var: {os.environ.get('BEADS_WORKING_DIR', 'NOT SET')}\n")
-        info.append(f"BEADS_PATH env var: {os.environ.get('BEADS_PATH', 'NOT SET')}\n")
-        info.append(f"BEADS_DB env var: {os.environ.get('BEADS_DB', 'NOT SET')}\n")
-        info.append(f"HOME: {os.environ.get('HOME', 'NOT SET')}\n")
-        info.append(f"USER: {os.environ.get('USER', 'NOT SET')}\n")
-        return "".join(info)
+def _prune_jobs() -> None:
+    """Forget finished jobs that nobody polled within _JOB_TTL seconds."""
+    cutoff = time.monotonic() - _JOB_TTL
+    for job_id, finished in list(_job_finished.items()):
+        if finished < cutoff:
+            del _job_finished[job_id]
+            _jobs.pop(job_id, None)
 
-    elif action == "migration":
-        return await beads_inspect_migration()
 
-    elif action == "pollution":
-        return await beads_detect_pollution(clean=clean)
+@mcp.tool(
+    name="poll_job",
+    description="""Check a job started with admin(..., background=True).
+Returns {"done": false} while running; once done, returns the result (or error) and forgets the job.
+Finished jobs that are not polled within 10 minutes are discarded.""",
+)
+async def poll_job(job_id: str) -> dict[str, Any]:
+    """Report the status of a background admin job.
+
+    Args:
+        job_id: ID returned by admin(..., background=True)
+
+    Returns:
+        {"job_id", "done"} plus "result" or "error" once the job has finished
+    """
+    task = _jobs.get(job_id)
+    if task is None:
+        raise ValueError(f"Unknown job: {job_id}")
+    if not task.done():
+        return {"job_id": job_id, "done": False}
+
+    del _jobs[job_id]
+    _job_finished.pop(job_id, None)
+    if task.cancelled():
+        return {"job_id": job_id, "done": True, "error": "Job was cancelled"}
+    error = task.exception()
+    if error is not None:
+        return {"job_id": job_id, "done": True, "error": str(error)}
+    return {"job_id": job_id, "done": True, "result": task.result()}
+
+
+# Tools callable from batch_execute, by tool name
+_BATCH_TOOLS: dict[str, FunctionTool] = {
+    tool.name: tool
+    for tool in (
+        ready_work, list_issues, show_issue, create_issue, update_issue,
+        close_issue, dep, comment, stats,
+    )
+}
 
-    else:
-        raise ValueError(f"Unknown action: {action}. Use 'validate', 'repair', 'schema', 'debug', 'migration', or 'pollution'")
+
+@mcp.tool(
+    name="batch_execute",
+    description="""Run several beads tool calls in one request.
+Each call is {"tool": name, "args": {...}}; results come back in call order as
+{"tool", "ok", "result"} or {"tool", "ok", "error"}.
+Calls run one at a time by default; raise max_concurrent only for independent calls.
+stop_on_error=True skips calls that have not started once one fails.""",
+)
+@tool_entry()
+async def batch_execute(
+    calls: list[BatchCall],
+    max_concurrent: int = 1,
+    stop_on_error: bool = False,
+    workspace_root: str | None = None,
+) -> list[dict[str, Any]]:
+    """Run multiple tool calls against one workspace in a single round-trip.
+
+    Args:
+        calls: Sub-calls as {"tool": name, "args": {...}}
+        max_concurrent: Maximum number of sub-calls in flight at once
+        stop_on_error: Skip sub-calls not yet started after the first failure
+        workspace_root: Workspace applied to sub-calls that don't set their own
+
+    Returns:
+        One entry per sub-call, in the order given
+    """
+    if max_concurrent < 1:
+        raise ValueError("max_concurrent must be at least 1")
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    failed = False
+
+    async def run(call: BatchCall) -> dict[str, Any]:
+        nonlocal failed
+        name = call.tool
+        async with semaphore:
+            if failed and stop_on_error:
+                return {"tool": name, "ok": False, "error": "Skipped after an earlier error"}
+            try:
+                tool = _BATCH_TOOLS.get(name)
+                if tool is None:
+                    raise ValueError(f"Unknown tool: {name}. Use one of {list(_BATCH_TOOLS)}")
+                if not tool.enabled:
+                    raise ValueError(f"Tool not loaded: {name}. Call load_tool() first")
+                args = dict(call.args)
+                if workspace_root:
+                    # Keep sub-calls on the batch workspace so tool_entry takes its fast path
+                    args.setdefault("workspace_root", workspace_root)
+                # Validate and coerce args the way FastMCP does for a direct call,
+                # but keep the Python result instead of rendering a ToolResult
+                result = await get_cached_typeadapter(tool.fn).validate_python(args)
+            except Exception as e:
+                failed = True
+                return {"tool": name, "ok": False, "error": str(e)}
+            return {"tool": name, "ok": True, "result": result}
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
+# Tools held back until requested when BEADS_MCP_PROGRESSIVE=1
+_LAZY_TOOLS: dict[str, FunctionTool] = {
+    tool.name: tool
+    for tool in (
+        ready_work, list_issues, show_issue, create_issue, update_issue,
+        close_issue, dep, comment, stats, admin, batch_execute, poll_job,
+    )
+}
+
+if PROGRESSIVE_TOOLS:
+    for _tool in _LAZY_TOOLS.values():
+        _tool.disable()
+
+
+def _force_exit() -> None:
+    """Exit after cleanup when the server task hasn't unwound within the grace period."""
+    cleanup()
+    logging.shutdown()
+    os._exit(0)
+
+
+def _request_shutdown(signum: int, main_task: "asyncio.Task[None]") -> None:
+    """Loop-side SIGTERM/SIGINT handler: cancel the server task so it unwinds cleanly.
+
+    The stdio transport reads stdin from a worker thread that cancellation can't
+    interrupt, so exit is forced if the task is still running after the grace period.
+    """
+    logger.info(f"Received {signal.Signals(signum).name}, shutting down gracefully...")
+    main_task.cancel()
+    asyncio.get_running_loop().call_later(_SHUTDOWN_GRACE, _force_exit)
+
+
+def _install_loop_signal_handlers() -> None:
+    """Route SIGTERM/SIGINT through the running loop instead of interrupting it.
+
+    Replaces the process-level handlers from _install_lifecycle_handlers() for
+    the lifetime of the loop; unsupported on Windows, where those stay in place.
+    """
+    if sys.platform == "win32" or threading.current_thread() is not threading.main_thread():
+        return
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    if main_task is None:
+        return
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, _request_shutdown, signum, main_task)
 
 
 async def async_main() -> None:
     """Async entry point for the MCP server."""
-    await mcp.run_async(transport="stdio")
+    _install_loop_signal_handlers()
+    try:
+        await mcp.run_async(transport="stdio")
+    except asyncio.CancelledError:
+        pass  # Shutdown requested by signal
+    finally:
+        cleanup()
+
+
+def _run_event_loop(main_coro: Coroutine[Any, Any, None]) -> None:
+    """Run main_coro on uvloop when it is installed, else on the default asyncio loop."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(main_coro)
+            return
+    asyncio.run(main_coro)
 
 
 def main() -> None:
     """Entry point for the MCP server."""
-    asyncio.run(async_main())
+    _install_lifecycle_handlers()
+    logger.info(f"beads-mcp v{get_version()} initialized with lifecycle management")
+    _run_event_loop(async_main())
 
 
 if __name__ == "__main__":
@@ -5,9 +5,10 @@ import logging
 import os
 import subprocess
 import sys
+import time
 from contextvars import ContextVar
 from functools import lru_cache
-from typing import Annotated, Any, TYPE_CHECKING
+from typing import Annotated, Any, Final, TYPE_CHECKING
 
 from .bd_client import create_bd_client, BdClientBase, BdError
 
@@ -43,6 +44,17 @@ _pool_lock = asyncio.Lock()
 # Version checking state (per-pool client)
 _version_checked: set[str] = set()
 
+# Last successful health check per workspace as (client, monotonic time); pooled
+# clients checked within _HEALTH_CHECK_INTERVAL are reused without a daemon ping
+_last_healthy: dict[str, tuple[BdClientBase, float]] = {}
+_HEALTH_CHECK_INTERVAL: Final[float] = 5.0
+
+# Seconds before a `git rev-parse` probe is killed
+_GIT_TIMEOUT: Final[float] = 5.0
+
+# Workspaces auto-detected from CWD, keyed by CWD (hits only)
+_autodetected_workspaces: dict[str, str] = {}
+
 # Default constants
 DEFAULT_ISSUE_TYPE: IssueType = "task"
 DEFAULT_DEPENDENCY_TYPE: DependencyType = "blocks"
@@ -56,13 +68,30 @@ def _register_client_for_cleanup(client: BdClientBase) -> None:
     """
     try:
         from . import server
-        if hasattr(server, '_daemon_clients'):
-            server._daemon_clients.append(client)
+        server.register_daemon_client(client)
     except (ImportError, AttributeError):
         # Server module not available or cleanup not initialized - that's ok
         pass
 
 
+def _beads_db_path(root: str) -> str | None:
+    """Find the first .db file in root/.beads/ (excluding backups) with one directory scan."""
+    try:
+        with os.scandir(os.path.join(root, ".beads")) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    name.endswith(".db")
+                    and not name.startswith(".")
+                    and ".backup" not in name
+                    and entry.is_file()
+                ):
+                    return entry.path
+    except OSError:
+        pass  # No readable .beads/ here
+    return None
+
+
 def _find_beads_db_in_tree(start_dir: str | None = None) -> str | None:
     """Walk up directory tree looking for .beads/*.db (matches Go CLI behavior).
     
@@ -72,8 +101,6 @@ def _find_beads_db_in_tree(start_dir: str | None = None) -> str | None:
     Returns:
         Absolute path to workspace root containing .beads/*.db, or None if not found
     """
-    import glob
-    
     try:
         current = os.path.abspath(start_dir or os.getcwd())
         
@@ -85,15 +112,9 @@ def _find_beads_db_in_tree(start_dir: str | None = None) -> str | None:
         
         # Walk up directory tree
         while True:
-            beads_dir = os.path.join(current, ".beads")
-            if os.path.isdir(beads_dir):
-                # Find any .db file in .beads/ (excluding backups)
-                db_files = glob.glob(os.path.join(beads_dir, "*.db"))
-                valid_dbs = [f for f in db_files if ".backup" not in os.path.basename(f)]
-                
-                if valid_dbs:
-                    # Return workspace root (parent of .beads), not the db path
-                    return current
+            if _beads_db_path(current) is not None:
+                # Return workspace root (parent of .beads), not the db path
+                return current
             
             parent = os.path.dirname(current)
             if parent == current:  # Reached filesystem root
@@ -103,10 +124,33 @@ def _find_beads_db_in_tree(start_dir: str | None = None) -> str | None:
         return None
         
     except Exception as e:
-        logger.debug(f"Failed to search for .beads in tree: {e}")
+        logger.debug("Failed to search for .beads in tree: %s", e)
         return None
 
 
+def _find_git_root(path: str) -> str | None:
+    """Walk up from path looking for a .git entry, without spawning git.
+    
+    A .git directory marks a normal checkout; a .git file marks a worktree or
+    submodule. Either way its parent is what `git rev-parse --show-toplevel`
+    reports.
+    
+    Args:
+        path: Directory path to start from
+        
+    Returns:
+        Directory containing .git (symlinks resolved, like git), or None if not found
+    """
+    current = os.path.realpath(path)
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:  # Reached filesystem root
+            return None
+        current = parent
+
+
 def _resolve_workspace_root(path: str) -> str:
     """Resolve workspace root to git repo root if inside a git repo.
     
@@ -116,6 +160,11 @@ def _resolve_workspace_root(path: str) -> str:
     Returns:
         Git repo root if inside git repo, otherwise the original path
     """
+    # Fast path: find .git on disk; only ask git when no marker is visible
+    git_root = _find_git_root(path)
+    if git_root is not None:
+        return git_root
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -125,11 +174,12 @@ def _resolve_workspace_root(path: str) -> str:
             check=False,
             shell=sys.platform == "win32",
             stdin=subprocess.DEVNULL,  # Prevent inheriting MCP's stdin
+            timeout=_GIT_TIMEOUT,  # Kills git on expiry rather than orphaning it
         )
         if result.returncode == 0:
             return result.stdout.strip()
     except Exception as e:
-        logger.debug(f"Git detection failed for {path}: {e}")
+        logger.debug("Git detection failed for %s: %s", path, e)
         pass
     
     return os.path.abspath(path)
@@ -222,6 +272,29 @@ async def _reconnect_client(canonical: str, max_retries: int = 3) -> BdClientBas
     )
 
 
+def _autodetect_workspace() -> str | None:
+    """Find the workspace for the process CWD, reusing earlier tree walks.
+    
+    A cached root is trusted only while its .beads/ still holds a database,
+    which costs one directory scan instead of a walk up the tree.
+    
+    Returns:
+        Workspace root containing .beads/*.db, or None if not found
+    """
+    cwd = os.getcwd()
+    workspace = _autodetected_workspaces.get(cwd)
+    if workspace is not None and _beads_db_path(workspace) is not None:
+        return workspace
+
+    workspace = _find_beads_db_in_tree(cwd)
+    if workspace:
+        logger.debug("Auto-detected workspace from CWD: %s", workspace)
+        _autodetected_workspaces[cwd] = workspace
+    else:
+        _autodetected_workspaces.pop(cwd, None)
+    return workspace
+
+
 async def _get_client() -> BdClientBase:
     """Get a BdClient instance for the current workspace.
     
@@ -231,8 +304,10 @@ async def _get_client() -> BdClientBase:
     2. BEADS_WORKING_DIR environment variable
     3. Walk up from CWD looking for .beads/*.db
     
-    Performs health check before returning cached client.
-    On failure, drops from pool and attempts reconnection with exponential backoff.
+    Performs health check before returning cached client, at most once per
+    _HEALTH_CHECK_INTERVAL so back-to-back tool calls don't each pay a daemon
+    round-trip. On failure, drops from pool and attempts reconnection with
+    exponential backoff.
     
     Performs version check on first connection to each workspace.
     Uses daemon client if available, falls back to CLI client.
@@ -248,9 +323,7 @@ async def _get_client() -> BdClientBase:
     
     # Auto-detect from CWD if not explicitly set (NEW!)
     if not workspace:
-        workspace = _find_beads_db_in_tree()
-        if workspace:
-            logger.debug(f"Auto-detected workspace from CWD: {workspace}")
+        workspace = _autodetect_workspace()
     
     if not workspace:
         raise BdError(
@@ -266,17 +339,24 @@ async def _get_client() -> BdClientBase:
     # Thread-safe connection pool access
     async with _pool_lock:
         if canonical in _connection_pool:
-            # Health check cached client before returning
             client = _connection_pool[canonical]
-            if not await _health_check_client(client):
+            now = time.monotonic()
+            last = _last_healthy.get(canonical)
+            if last is not None and last[0] is client and now - last[1] < _HEALTH_CHECK_INTERVAL:
+                pass  # Verified recently; skip the ping
+            elif await _health_check_client(client):
+                _last_healthy[canonical] = (client, now)
+            else:
                 # Stale connection - remove from pool and reconnect
                 del _connection_pool[canonical]
+                _last_healthy.pop(canonical, None)
                 if canonical in _version_checked:
                     _version_checked.remove(canonical)
                 
-                # Attempt reconnection with backoff
+                # Attempt reconnection with backoff (the new client was just pinged)
                 client = await _reconnect_client(canonical)
                 _connection_pool[canonical] = client
+                _last_healthy[canonical] = (client, time.monotonic())
         else:
             # Create new client for this workspace
             use_daemon = os.environ.get("BEADS_USE_DAEMON", "1") == "1"
@@ -338,6 +418,7 @@ async def beads_list_issues(
     query: Annotated[str | None, "Search in title (case-insensitive substring)"] = None,
     unassigned: Annotated[bool, "Filter to only unassigned issues"] = False,
     limit: Annotated[int, "Maximum number of issues to return (1-100)"] = 20,
+    include_dependencies: Annotated[bool, "Parse dependencies/dependents (False leaves them empty)"] = True,
 ) -> list[Issue]:
     """List all issues with optional filters."""
     client = await _get_client()
@@ -352,6 +433,7 @@ async def beads_list_issues(
         query=query,
         unassigned=unassigned,
         limit=limit,
+        include_dependencies=include_dependencies,
     )
     return await client.list_issues(params)
 
@@ -0,0 +1,90 @@
+"""Tests for background admin jobs and poll_job."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_admin_background_job_polls_to_result():
+    """Test admin(background=True) returns a job ID whose result poll_job reports once."""
+    from beads_mcp import server
+
+    release = asyncio.Event()
+    seen: list[str | None] = []
+
+    async def slow_migration():
+        seen.append(server.current_workspace.get())
+        await release.wait()
+        return {"pending": 0}
+
+    with patch("beads_mcp.server.beads_inspect_migration", AsyncMock(side_effect=slow_migration)):
+        started = await server.admin.fn(action="migration", background=True, workspace_root="/tmp/job-ws")
+        job_id = started["job_id"]
+
+        assert await server.poll_job.fn(job_id=job_id) == {"job_id": job_id, "done": False}
+
+        release.set()
+        await server._jobs[job_id]
+
+        assert await server.poll_job.fn(job_id=job_id) == {
+            "job_id": job_id, "done": True, "result": {"pending": 0},
+        }
+
+    assert seen == ["/tmp/job-ws"]
+    assert job_id not in server._jobs
+
+
+@pytest.mark.asyncio
+async def test_poll_job_reports_errors_and_unknown_ids():
+    """Test poll_job surfaces job failures and rejects unknown IDs."""
+    from beads_mcp import server
+
+    with patch("beads_mcp.server.beads_repair_deps", AsyncMock(side_effect=RuntimeError("db locked"))):
+        job_id = (await server.admin.fn(action="repair", background=True))["job_id"]
+        await asyncio.gather(server._jobs[job_id], return_exceptions=True)
+
+    assert await server.poll_job.fn(job_id=job_id) == {"job_id": job_id, "done": True, "error": "db locked"}
+
+    with pytest.raises(ValueError, match="Unknown job"):
+        await server.poll_job.fn(job_id=job_id)
+
+
+@pytest.mark.asyncio
+async def test_unpolled_finished_job_is_evicted():
+    """Test a finished job nobody polls is dropped once it outlives the TTL."""
+    from beads_mcp import server
+
+    with patch("beads_mcp.server.beads_repair_deps", AsyncMock(return_value={"fixed": 0})):
+        stale_id = (await server.admin.fn(action="repair", background=True))["job_id"]
+        await server._jobs[stale_id]
+        assert stale_id in server._job_finished
+
+        later = time.monotonic() + server._JOB_TTL + 1
+        with patch("beads_mcp.server.time.monotonic", return_value=later):
+            fresh_id = (await server.admin.fn(action="repair", background=True))["job_id"]
+        await server._jobs[fresh_id]
+
+    assert stale_id not in server._jobs
+    assert stale_id not in server._job_finished
+    assert (await server.poll_job.fn(job_id=fresh_id))["result"] == {"fixed": 0}
+
+
+@pytest.mark.asyncio
+async def test_cleanup_cancels_running_jobs(monkeypatch):
+    """Test cleanup() cancels background jobs that are still running."""
+    from beads_mcp import server
+
+    release = asyncio.Event()
+    with patch("beads_mcp.server.beads_inspect_migration", AsyncMock(side_effect=release.wait)):
+        job_id = (await server.admin.fn(action="migration", background=True))["job_id"]
+        task = server._jobs[job_id]
+
+        monkeypatch.setattr(server, "_cleanup_done", False)
+        server.cleanup()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert task.cancelled()
+    assert server._jobs == {}
@@ -0,0 +1,118 @@
+"""Tests for the batch_execute MCP tool."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastmcp.utilities.types import get_cached_typeadapter
+from pydantic import ValidationError
+
+from beads_mcp.models import BatchCall
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_returns_results_in_order():
+    """Test sub-calls run against the batch workspace and report per-call outcomes."""
+    from beads_mcp import server
+
+    seen: list[str | None] = []
+
+    async def fake_close(issue_id, reason="Completed"):
+        seen.append(server.current_workspace.get())
+        if issue_id == "bd-bad":
+            raise ValueError("no such issue")
+        return []
+
+    with patch("beads_mcp.server.beads_close_issue", AsyncMock(side_effect=fake_close)):
+        results = await server.batch_execute.fn(
+            calls=[
+                BatchCall(tool="close", args={"issue_id": "bd-1"}),
+                BatchCall(tool="close", args={"issue_id": "bd-bad"}),
+                BatchCall(tool="nope"),
+            ],
+            workspace_root="/tmp/batch-ws",
+        )
+
+    assert [r["ok"] for r in results] == [True, False, False]
+    assert results[0]["result"].id == "bd-1"
+    assert results[1]["error"] == "no such issue"
+    assert results[2]["error"].startswith("Unknown tool: nope")
+    assert seen == ["/tmp/batch-ws", "/tmp/batch-ws"]
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_stop_on_error_skips_remaining_calls():
+    """Test stop_on_error leaves later calls unexecuted after a failure."""
+    from beads_mcp import server
+
+    mock_close = AsyncMock(side_effect=ValueError("boom"))
+
+    with patch("beads_mcp.server.beads_close_issue", mock_close):
+        results = await server.batch_execute.fn(
+            calls=[
+                BatchCall(tool="close", args={"issue_id": "bd-1"}),
+                BatchCall(tool="close", args={"issue_id": "bd-2"}),
+            ],
+            stop_on_error=True,
+            workspace_root="/tmp/batch-ws",
+        )
+
+    assert mock_close.await_count == 1
+    assert results[1] == {"tool": "close", "ok": False, "error": "Skipped after an earlier error"}
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_validates_args_like_a_direct_call():
+    """Test sub-call args are validated and coerced against the tool's signature."""
+    from beads_mcp import server
+
+    mock_update = AsyncMock(return_value=None)
+
+    with patch("beads_mcp.server.beads_update_issue", mock_update):
+        results = await server.batch_execute.fn(
+            calls=[
+                BatchCall(tool="update", args={"issue_id": "bd-1", "status": "bogus"}),
+                BatchCall(tool="update", args={"issue_id": "bd-1", "colour": "red"}),
+                BatchCall(tool="update", args={"issue_id": "bd-1", "priority": "1"}),
+            ],
+            workspace_root="/tmp/batch-ws",
+        )
+
+    assert [r["ok"] for r in results] == [False, False, True]
+    assert "status" in results[0]["error"]
+    assert "colour" in results[1]["error"]
+    mock_update.assert_awaited_once()
+    assert mock_update.await_args.kwargs["priority"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_rejects_disabled_tools():
+    """Test tools held back by progressive loading can't be reached through a batch."""
+    from beads_mcp import server
+
+    mock_close = AsyncMock(return_value=[])
+    server.close_issue.disable()
+    try:
+        with patch("beads_mcp.server.beads_close_issue", mock_close):
+            results = await server.batch_execute.fn(
+                calls=[BatchCall(tool="close", args={"issue_id": "bd-1"})],
+                workspace_root="/tmp/batch-ws",
+            )
+    finally:
+        server.close_issue.enable()
+
+    assert results[0]["ok"] is False
+    assert results[0]["error"].startswith("Tool not loaded: close")
+    mock_close.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "call",
+    [{"tool": "stats", "args": "bad"}, {"tool": ["x"]}, {"args": {}}],
+)
+def test_batch_execute_schema_rejects_malformed_calls(call):
+    """Test malformed sub-calls are rejected by the tool schema before anything runs."""
+    from beads_mcp import server
+
+    adapter = get_cached_typeadapter(server.batch_execute.fn)
+    with pytest.raises(ValidationError):
+        adapter.validate_python({"calls": [{"tool": "stats"}, call]})
@@ -203,6 +203,40 @@ async def test_list_issues(bd_client, mock_process):
     assert issues[0].id == "bd-1"
 
 
+@pytest.mark.asyncio
+async def test_list_issues_without_dependencies(bd_client, mock_process):
+    """Test list_issues skips nested dependencies when include_dependencies=False."""
+    linked = {
+        "id": "bd-2",
+        "title": "Blocker",
+        "status": "open",
+        "priority": 1,
+        "issue_type": "task",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+    }
+    issues_data = [
+        {
+            "id": "bd-1",
+            "title": "Issue 1",
+            "status": "open",
+            "priority": 1,
+            "issue_type": "bug",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "dependencies": [linked],
+            "dependents": [linked],
+        },
+    ]
+    mock_process.communicate = AsyncMock(return_value=(json.dumps(issues_data).encode(), b""))
+
+    with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+        issues = await bd_client.list_issues(ListIssuesParams(include_dependencies=False))
+
+    assert issues[0].dependencies == []
+    assert issues[0].dependents == []
+
+
 @pytest.mark.asyncio
 async def test_list_issues_invalid_response(bd_client, mock_process):
     """Test list_issues method with invalid response type."""
@@ -5,11 +5,38 @@ can be configured via environment variables.
 """
 
 import os
-import pytest
 import subprocess
 import sys
 
 
+def _load_compaction_settings(
+    threshold: str | None = None, preview: str | None = None
+) -> subprocess.CompletedProcess:
+    """Import the server module in a fresh interpreter with the given env vars.
+
+    The settings are module-level constants, so each configuration needs its own process.
+    """
+    env = os.environ.copy()
+    env.pop("BEADS_MCP_COMPACTION_THRESHOLD", None)
+    env.pop("BEADS_MCP_PREVIEW_COUNT", None)
+    if threshold is not None:
+        env["BEADS_MCP_COMPACTION_THRESHOLD"] = threshold
+    if preview is not None:
+        env["BEADS_MCP_PREVIEW_COUNT"] = preview
+
+    code = """
+from beads_mcp import server
+print(f"threshold={server.COMPACTION_THRESHOLD}")
+print(f"preview={server.PREVIEW_COUNT}")
+"""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
 class TestCompactionConfigEnvironmentVariables:
     """Test environment variable configuration for compaction settings."""
 
@@ -69,109 +96,58 @@ print(f"preview={server.PREVIEW_COUNT}")
         assert "threshold=50" in result.stdout or "threshold=20" in result.stdout  # May be cached
         # Due to module caching, we test the function directly instead
 
-    def test_get_compaction_settings_with_defaults(self):
-        """Test _get_compaction_settings() returns defaults when no env vars set."""
-        # Save original env vars
-        orig_threshold = os.environ.pop("BEADS_MCP_COMPACTION_THRESHOLD", None)
-        orig_preview = os.environ.pop("BEADS_MCP_PREVIEW_COUNT", None)
-        
-        try:
-            # Import and call the function
-            from beads_mcp.server import _get_compaction_settings
-            threshold, preview = _get_compaction_settings()
-            
-            assert threshold == 20
-            assert preview == 5
-        finally:
-            # Restore env vars
-            if orig_threshold:
-                os.environ["BEADS_MCP_COMPACTION_THRESHOLD"] = orig_threshold
-            if orig_preview:
-                os.environ["BEADS_MCP_PREVIEW_COUNT"] = orig_preview
-
-    def test_get_compaction_settings_with_custom_values(self):
-        """Test _get_compaction_settings() respects custom values."""
-        # Set custom values
-        os.environ["BEADS_MCP_COMPACTION_THRESHOLD"] = "100"
-        os.environ["BEADS_MCP_PREVIEW_COUNT"] = "15"
-        
-        try:
-            from beads_mcp.server import _get_compaction_settings
-            threshold, preview = _get_compaction_settings()
-            
-            assert threshold == 100
-            assert preview == 15
-        finally:
-            # Clean up
-            os.environ.pop("BEADS_MCP_COMPACTION_THRESHOLD", None)
-            os.environ.pop("BEADS_MCP_PREVIEW_COUNT", None)
-
-    def test_get_compaction_settings_validates_threshold_minimum(self):
+    def test_compaction_settings_with_defaults(self):
+        """Test module constants fall back to defaults when no env vars set."""
+        result = _load_compaction_settings()
+
+        assert result.returncode == 0, result.stderr
+        assert "threshold=20" in result.stdout
+        assert "preview=5" in result.stdout
+
+    def test_compaction_settings_with_custom_values(self):
+        """Test module constants respect custom values."""
+        result = _load_compaction_settings(threshold="100", preview="15")
+
+        assert result.returncode == 0, result.stderr
+        assert "threshold=100" in result.stdout
+        assert "preview=15" in result.stdout
+
+    def test_compaction_settings_validates_threshold_minimum(self):
         """Test validation: threshold must be >= 1."""
-        os.environ["BEADS_MCP_COMPACTION_THRESHOLD"] = "0"
-        
-        try:
-            from beads_mcp.server import _get_compaction_settings
-            with pytest.raises(ValueError, match="BEADS_MCP_COMPACTION_THRESHOLD must be >= 1"):
-                _get_compaction_settings()
-        finally:
-            os.environ.pop("BEADS_MCP_COMPACTION_THRESHOLD", None)
-
-    def test_get_compaction_settings_validates_preview_minimum(self):
+        result = _load_compaction_settings(threshold="0")
+
+        assert result.returncode != 0
+        assert "BEADS_MCP_COMPACTION_THRESHOLD must be >= 1" in result.stderr
+
+    def test_compaction_settings_validates_preview_minimum(self):
         """Test validation: preview_count must be >= 1."""
-        os.environ["BEADS_MCP_COMPACTION_THRESHOLD"] = "20"
-        os.environ["BEADS_MCP_PREVIEW_COUNT"] = "0"
-        
-        try:
-            from beads_mcp.server import _get_compaction_settings
-            with pytest.raises(ValueError, match="BEADS_MCP_PREVIEW_COUNT must be >= 1"):
-                _get_compaction_settings()
-        finally:
-            os.environ.pop("BEADS_MCP_COMPACTION_THRESHOLD", None)
-            os.environ.pop("BEADS_MCP_PREVIEW_COUNT", None)
-
-    def test_get_compaction_settings_validates_preview_not_greater_than_threshold(self):
+        result = _load_compaction_settings(threshold="20", preview="0")
+
+        assert result.returncode != 0
+        assert "BEADS_MCP_PREVIEW_COUNT must be >= 1" in result.stderr
+
+    def test_compaction_settings_validates_preview_not_greater_than_threshold(self):
         """Test validation: preview_count must be <= threshold."""
-        os.environ["BEADS_MCP_COMPACTION_THRESHOLD"] = "10"
-        os.environ["BEADS_MCP_PREVIEW_COUNT"] = "20"
-        
-        try:
-            from beads_mcp.server import _get_compaction_settings
-            with pytest.raises(ValueError, match="BEADS_MCP_PREVIEW_COUNT must be <= BEADS_MCP_COMPACTION_THRESHOLD"):
-                _get_compaction_settings()
-        finally:
-            os.environ.pop("BEADS_MCP_COMPACTION_THRESHOLD", None)
-            os.environ.pop("BEADS_MCP_PREVIEW_COUNT", None)
-
-    def test_get_compaction_settings_with_edge_case_values(self):
+        result = _load_compaction_settings(threshold="10", preview="20")
+
+        assert result.returncode != 0
+        assert "BEADS_MCP_PREVIEW_COUNT must be <= BEADS_MCP_COMPACTION_THRESHOLD" in result.stderr
+
+    def test_compaction_settings_with_edge_case_values(self):
         """Test edge case: preview_count == threshold."""
-        os.environ["BEADS_MCP_COMPACTION_THRESHOLD"] = "5"
-        os.environ["BEADS_MCP_PREVIEW_COUNT"] = "5"
-        
-        try:
-            from beads_mcp.server import _get_compaction_settings
-            threshold, preview = _get_compaction_settings()
-            
-            assert threshold == 5
-            assert preview == 5
-        finally:
-            os.environ.pop("BEADS_MCP_COMPACTION_THRESHOLD", None)
-            os.environ.pop("BEADS_MCP_PREVIEW_COUNT", None)
-
-    def test_get_compaction_settings_with_large_values(self):
+        result = _load_compaction_settings(threshold="5", preview="5")
+
+        assert result.returncode == 0, result.stderr
+        assert "threshold=5" in result.stdout
+        assert "preview=5" in result.stdout
+
+    def test_compaction_settings_with_large_values(self):
         """Test large custom values."""
-        os.environ["BEADS_MCP_COMPACTION_THRESHOLD"] = "1000"
-        os.environ["BEADS_MCP_PREVIEW_COUNT"] = "100"
-        
-        try:
-            from beads_mcp.server import _get_compaction_settings
-            threshold, preview = _get_compaction_settings()
-            
-            assert threshold == 1000
-            assert preview == 100
-        finally:
-            os.environ.pop("BEADS_MCP_COMPACTION_THRESHOLD", None)
-            os.environ.pop("BEADS_MCP_PREVIEW_COUNT", None)
+        result = _load_compaction_settings(threshold="1000", preview="100")
+
+        assert result.returncode == 0, result.stderr
+        assert "threshold=1000" in result.stdout
+        assert "preview=100" in result.stdout
 
 
 class TestCompactionConfigDocumentation:
@@ -228,6 +228,37 @@ async def test_get_client_uses_cached_healthy_client(monkeypatch):
         mock_health.assert_called_once_with(mock_client)
 
 
+@pytest.mark.asyncio
+async def test_get_client_skips_recent_health_check(monkeypatch):
+    """Test that _get_client pings a pooled client at most once per interval."""
+    from beads_mcp import tools
+    
+    monkeypatch.setenv("BEADS_WORKING_DIR", "/tmp/test")
+    
+    mock_client = MagicMock()
+    
+    with (
+        patch('beads_mcp.tools._canonicalize_path', return_value="/tmp/test"),
+        patch('beads_mcp.tools._health_check_client', new_callable=AsyncMock) as mock_health,
+        patch('beads_mcp.tools.time.monotonic', side_effect=[100.0, 101.0, 100.0 + tools._HEALTH_CHECK_INTERVAL]),
+    ):
+        mock_health.return_value = True
+        
+        tools._last_healthy.clear()
+        tools._connection_pool["/tmp/test"] = mock_client
+        tools._version_checked.add("/tmp/test")
+        
+        await _get_client()
+        await _get_client()
+        assert mock_health.await_count == 1
+        
+        # Interval elapsed: ping again
+        await _get_client()
+        assert mock_health.await_count == 2
+    
+    tools._last_healthy.clear()
+
+
 @pytest.mark.asyncio
 async def test_get_client_reconnects_on_stale_connection(monkeypatch):
     """Test that _get_client reconnects when cached client is stale."""
@@ -3,6 +3,7 @@
 import asyncio
 import signal
 import sys
+import weakref
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -29,11 +30,11 @@ def test_cleanup_handlers_registered():
 
 def test_cleanup_function_safe_to_call_multiple_times():
     """Test that cleanup function can be called multiple times safely."""
-    from beads_mcp.server import cleanup, _daemon_clients
+    from beads_mcp.server import cleanup, register_daemon_client, _daemon_clients
     
     # Mock client
     mock_client = MagicMock()
-    _daemon_clients.append(mock_client)
+    register_daemon_client(mock_client)
     
     # Call cleanup multiple times
     cleanup()
@@ -47,7 +48,7 @@ def test_cleanup_function_safe_to_call_multiple_times():
 
 def test_cleanup_handles_client_errors_gracefully():
     """Test that cleanup continues even if a client raises an error."""
-    from beads_mcp.server import cleanup, _daemon_clients
+    from beads_mcp.server import cleanup, register_daemon_client, _daemon_clients
     
     # Reset state
     import beads_mcp.server as server
@@ -60,7 +61,8 @@ def test_cleanup_handles_client_errors_gracefully():
     good_client = MagicMock()
     
     _daemon_clients.clear()
-    _daemon_clients.extend([failing_client, good_client])
+    register_daemon_client(failing_client)
+    register_daemon_client(good_client)
     
     # Cleanup should not raise
     cleanup()
@@ -71,6 +73,22 @@ def test_cleanup_handles_client_errors_gracefully():
     assert len(_daemon_clients) == 0
 
 
+def test_dropped_clients_are_not_retained():
+    """Test that registration doesn't keep discarded clients alive."""
+    import gc
+
+    from beads_mcp.server import _daemon_clients, register_daemon_client
+
+    _daemon_clients.clear()
+    client = MagicMock()
+    register_daemon_client(client)
+    assert len(_daemon_clients) == 1
+
+    del client
+    gc.collect()
+    assert len(_daemon_clients) == 0
+
+
 def test_signal_handler_calls_cleanup():
     """Test that signal handler calls cleanup and exits."""
     from beads_mcp.server import signal_handler
@@ -87,6 +105,22 @@ def test_signal_handler_calls_cleanup():
             assert mock_exit.called
 
 
+@pytest.mark.asyncio
+async def test_request_shutdown_cancels_task_and_schedules_forced_exit():
+    """Test that the loop signal handler cancels the server task with a forced-exit deadline."""
+    from beads_mcp import server
+
+    main_task = asyncio.create_task(asyncio.sleep(60))
+    loop = asyncio.get_running_loop()
+
+    with patch.object(loop, 'call_later') as mock_call_later:
+        server._request_shutdown(signal.SIGTERM, main_task)
+
+    mock_call_later.assert_called_once_with(server._SHUTDOWN_GRACE, server._force_exit)
+    with pytest.raises(asyncio.CancelledError):
+        await main_task
+
+
 @pytest.mark.asyncio
 async def test_client_registration_on_first_use():
     """Test that client is registered for cleanup on first use."""
@@ -103,7 +137,7 @@ async def test_client_registration_on_first_use():
     # since _get_client() needs a valid workspace context. The key behavior
     # (cleanup list management) is already tested in other lifecycle tests.
     # This test verifies the cleanup infrastructure exists.
-    assert isinstance(_daemon_clients, list)
+    assert isinstance(_daemon_clients, weakref.WeakSet)
 
 
 def test_cleanup_logs_lifecycle_events(caplog):
@@ -125,5 +159,30 @@ def test_cleanup_logs_lifecycle_events(caplog):
     assert any("Cleanup complete" in msg for msg in log_messages)
 
 
+def test_import_does_not_install_signal_handlers():
+    """Test that importing the server leaves signal handling to the host process."""
+    import beads_mcp.server  # noqa: F401
+
+    assert signal.getsignal(signal.SIGTERM) is not beads_mcp.server.signal_handler
+    assert signal.getsignal(signal.SIGINT) is not beads_mcp.server.signal_handler
+
+
+def test_install_lifecycle_handlers_registers_signals():
+    """Test that _install_lifecycle_handlers wires cleanup to exit and signals."""
+    from beads_mcp import server
+
+    with (
+        patch('beads_mcp.server.atexit.register') as mock_register,
+        patch('beads_mcp.server.signal.signal') as mock_signal,
+    ):
+        server._install_lifecycle_handlers()
+
+    mock_register.assert_called_once_with(server.cleanup)
+    registered = {call.args[0] for call in mock_signal.call_args_list}
+    assert signal.SIGINT in registered
+    if sys.platform != "win32":
+        assert signal.SIGTERM in registered
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
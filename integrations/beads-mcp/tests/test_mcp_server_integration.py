@@ -108,6 +108,58 @@ async def test_quickstart_resource(mcp_client):
     assert "beads" in content.lower() or "bd" in content.lower()
 
 
+@pytest.mark.asyncio
+async def test_usage_resource():
+    """Test beads://usage serves the tool reference kept out of the instructions."""
+    async with Client(mcp) as client:
+        result = await client.read_resource("beads://usage")
+        assert "## Quick Reference" in result[0].text
+        assert "beads://usage" in client.initialize_result.instructions
+        assert "## Quick Reference" not in client.initialize_result.instructions
+
+
+@pytest.mark.asyncio
+async def test_quickstart_resource_uses_context_workspace(monkeypatch):
+    """Test beads://quickstart runs against the workspace recorded by context set."""
+    from unittest.mock import AsyncMock
+
+    from beads_mcp import server
+    from beads_mcp.tools import current_workspace
+
+    seen: list[str | None] = []
+
+    async def fake_quickstart():
+        seen.append(current_workspace.get())
+        return "quickstart"
+
+    workspace = server._WorkspaceContext("/tmp/ctx-ws", None, True)
+    monkeypatch.setattr(server, "_workspace_context", workspace)
+    monkeypatch.setattr(server, "beads_quickstart", AsyncMock(side_effect=fake_quickstart))
+    async with Client(mcp) as client:
+        result = await client.read_resource("beads://quickstart")
+
+    assert result[0].text == "quickstart"
+    assert seen == ["/tmp/ctx-ws"]
+
+
+@pytest.mark.asyncio
+async def test_dep_tree_brief_nodes():
+    """Test dep(action="tree") projects raw bd nodes to BriefTreeNode."""
+    from unittest.mock import AsyncMock, patch
+
+    from beads_mcp import server
+
+    nodes = [
+        {"id": "bd-1", "title": "Root", "status": "open", "priority": 1},
+        {"id": "bd-2", "title": "Child", "status": "closed", "depth": 1, "truncated": True},
+    ]
+    with patch("beads_mcp.server.beads_dep_tree", AsyncMock(return_value={"nodes": nodes})):
+        result = await server.dep.fn(action="tree", issue_id="bd-1", workspace_root="/tmp/ws")
+
+    assert [(n.id, n.depth, n.truncated) for n in result] == [("bd-1", 0, False), ("bd-2", 1, True)]
+    assert not hasattr(result[0], "priority")
+
+
 @pytest.mark.asyncio
 async def test_create_issue_tool(mcp_client):
     """Test create_issue tool."""
@@ -672,6 +724,21 @@ async def test_context_default_show(mcp_client, temp_db):
     assert "Database:" in output
 
 
+@pytest.mark.asyncio
+async def test_context_show_tracks_actor_changes(monkeypatch):
+    """Test cached context(action='show') output picks up a changed BEADS_ACTOR."""
+    from beads_mcp import server
+
+    workspace = server._WorkspaceContext("/tmp/ws", "/tmp/ws/.beads/x.db", True)
+    monkeypatch.setattr(server, "_workspace_context", workspace)
+    monkeypatch.setattr(server, "_show_cache", None)
+    monkeypatch.setenv("BEADS_ACTOR", "alice")
+    assert "Actor: alice" in await server.context.fn(action="show")
+
+    monkeypatch.setenv("BEADS_ACTOR", "bob")
+    assert "Actor: bob" in await server.context.fn(action="show")
+
+
 # =============================================================================
 # OUTPUT CONTROL PARAMETER TESTS
 # =============================================================================
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+import subprocess
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -279,6 +280,41 @@ class TestPathCanonicalization:
                 # Compare as realpath to handle macOS /var -> /private/var
                 assert os.path.realpath(resolved) == os.path.realpath(str(project))
 
+    def test_resolve_workspace_root_finds_git_marker_without_subprocess(self):
+        """Test _resolve_workspace_root uses a .git dir/file on disk before spawning git."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Path(tmpdir) / "repo"
+            (repo / ".git").mkdir(parents=True)
+            subdir = repo / "src" / "pkg"
+            subdir.mkdir(parents=True)
+
+            worktree = Path(tmpdir) / "worktree"
+            worktree.mkdir()
+            (worktree / ".git").write_text("gitdir: ../repo/.git/worktrees/wt\n")
+
+            with patch("beads_mcp.tools.subprocess.run") as mock_run:
+                assert _resolve_workspace_root(str(subdir)) == os.path.realpath(repo)
+                assert _resolve_workspace_root(str(worktree)) == os.path.realpath(worktree)
+                mock_run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_context_set_reports_git_timeout(self):
+        """Test context(action="set") reports a git probe killed by its timeout."""
+        from beads_mcp import server
+
+        server._resolve_workspace_root.cache_clear()
+        timeout = subprocess.TimeoutExpired(["git", "rev-parse"], server._GIT_TIMEOUT)
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("beads_mcp.server._find_git_root", return_value=None),
+            patch("beads_mcp.server.subprocess.run", side_effect=timeout) as mock_run,
+        ):
+            result = await server.context.fn(action="set", workspace_root=tmpdir)
+
+        assert result.startswith("Error: Git repository detection timed out.")
+        assert mock_run.call_args.kwargs["timeout"] == server._GIT_TIMEOUT
+        assert server._resolve_workspace_root.cache_info().currsize == 0
+
 
 class TestCrossProjectIsolation:
     """Test that projects don't leak data to each other."""
@@ -0,0 +1,67 @@
+"""Tests for progressive tool loading via BEADS_MCP_PROGRESSIVE.
+
+The flag is read at import time, so each configuration runs in a fresh interpreter.
+"""
+
+import os
+import subprocess
+import sys
+
+_LIST_TOOLS = """
+import asyncio
+from fastmcp import Client
+from beads_mcp.server import PROGRESSIVE_TOOLS, mcp
+
+async def main():
+    async with Client(mcp) as client:
+        print("initial=" + ",".join(t.name for t in await client.list_tools()))
+        if not PROGRESSIVE_TOOLS:
+            return
+        await client.call_tool("get_tool_info", {"tool_name": "ready"})
+        await client.call_tool("load_tool", {"tool_name": "stats"})
+        print("loaded=" + ",".join(t.name for t in await client.list_tools()))
+
+asyncio.run(main())
+"""
+
+
+def _run_server_script(progressive: bool) -> subprocess.CompletedProcess:
+    env = os.environ.copy()
+    env.pop("BEADS_MCP_PROGRESSIVE", None)
+    if progressive:
+        env["BEADS_MCP_PROGRESSIVE"] = "1"
+    return subprocess.run(
+        [sys.executable, "-c", _LIST_TOOLS],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _tool_names(stdout: str, prefix: str) -> set[str]:
+    for line in stdout.splitlines():
+        if line.startswith(prefix):
+            return set(line[len(prefix):].split(","))
+    raise AssertionError(f"{prefix!r} not found in output: {stdout!r}")
+
+
+def test_progressive_mode_lists_discovery_tools_only():
+    """Test only discovery tools are listed until others are loaded."""
+    result = _run_server_script(progressive=True)
+    assert result.returncode == 0, result.stderr
+
+    initial = _tool_names(result.stdout, "initial=")
+    assert initial == {"discover_tools", "get_tool_info", "load_tool", "context"}
+
+    loaded = _tool_names(result.stdout, "loaded=")
+    assert loaded == initial | {"ready", "stats"}
+
+
+def test_default_mode_lists_all_tools():
+    """Test all tools are listed when progressive mode is off."""
+    result = _run_server_script(progressive=False)
+    assert result.returncode == 0, result.stderr
+
+    initial = _tool_names(result.stdout, "initial=")
+    assert {"ready", "list", "show", "create", "admin"} <= initial
+    assert "load_tool" not in initial
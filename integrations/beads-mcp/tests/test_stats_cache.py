@@ -0,0 +1,90 @@
+"""Tests for the short-lived stats() cache in the MCP server."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from beads_mcp.models import Stats
+
+
+def _stats(total: int) -> Stats:
+    return Stats(
+        total_issues=total,
+        open_issues=total,
+        in_progress_issues=0,
+        closed_issues=0,
+        blocked_issues=0,
+        ready_issues=total,
+        average_lead_time_hours=0.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stats_reused_within_ttl_and_dropped_by_writes():
+    """Test stats() serves repeat calls from cache until a write tool runs."""
+    from beads_mcp import server
+
+    server._stats_cache.clear()
+    mock_stats = AsyncMock(side_effect=[_stats(1), _stats(2)])
+    mock_close = AsyncMock(return_value=[])
+
+    with patch("beads_mcp.server.beads_stats", mock_stats), \
+         patch("beads_mcp.server.beads_close_issue", mock_close):
+        first = await server.stats.fn(workspace_root="/tmp/ws")
+        second = await server.stats.fn(workspace_root="/tmp/ws")
+        assert first is second
+        assert mock_stats.await_count == 1
+
+        await server.close_issue.fn(issue_id="bd-1", workspace_root="/tmp/ws")
+
+        third = await server.stats.fn(workspace_root="/tmp/ws")
+        assert third.total_issues == 2
+        assert mock_stats.await_count == 2
+
+    server._stats_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_stats_cache_expires():
+    """Test stats() recomputes once the TTL has passed."""
+    from beads_mcp import server
+
+    server._stats_cache.clear()
+    mock_stats = AsyncMock(side_effect=[_stats(1), _stats(2)])
+
+    expired = 100.0 + server._STATS_TTL
+
+    with patch("beads_mcp.server.beads_stats", mock_stats), \
+         patch("beads_mcp.server.time.monotonic", side_effect=[100.0, expired, expired]):
+        await server.stats.fn(workspace_root="/tmp/ws")
+        result = await server.stats.fn(workspace_root="/tmp/ws")
+
+    assert result.total_issues == 2
+    server._stats_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_stats_result_not_cached_when_a_write_lands_mid_call():
+    """Test a stats() result computed before a concurrent write isn't reused after it."""
+    from beads_mcp import server
+
+    server._stats_cache.clear()
+    totals = iter([1, 2])
+
+    async def fake_stats():
+        total = next(totals)
+        if total == 1:
+            server._invalidate_stats()  # A write finishes while this call is in flight
+        return _stats(total)
+
+    mock_stats = AsyncMock(side_effect=fake_stats)
+
+    with patch("beads_mcp.server.beads_stats", mock_stats):
+        await server.stats.fn(workspace_root="/tmp/ws")
+        assert "/tmp/ws" not in server._stats_cache
+
+        result = await server.stats.fn(workspace_root="/tmp/ws")
+
+    assert result.total_issues == 2
+    assert mock_stats.await_count == 2
+    server._stats_cache.clear()
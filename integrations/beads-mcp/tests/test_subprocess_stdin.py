@@ -111,6 +111,7 @@ class TestServerSubprocessStdin:
         """Test that _resolve_workspace_root passes stdin=DEVNULL to git subprocess."""
         from beads_mcp.server import _resolve_workspace_root
 
+        _resolve_workspace_root.cache_clear()
         with patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0, stdout="/repo/root\n")
 
@@ -2,6 +2,7 @@
 
 import os
 import pytest
+import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -93,6 +94,46 @@ async def test_get_client_auto_detect_from_cwd():
             current_workspace.reset(token)
 
 
+def test_autodetect_workspace_reuses_cached_root(monkeypatch):
+    """Test CWD auto-detection walks the tree once while .beads/ still exists."""
+    from beads_mcp import tools
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / ".beads").mkdir()
+        (Path(tmpdir) / ".beads" / "beads.db").touch()
+        monkeypatch.chdir(tmpdir)
+        tools._autodetected_workspaces.clear()
+
+        assert tools._autodetect_workspace() == os.path.realpath(tmpdir)
+        with patch("beads_mcp.tools._find_beads_db_in_tree") as mock_find:
+            assert tools._autodetect_workspace() == os.path.realpath(tmpdir)
+            mock_find.assert_not_called()
+
+        # Removing .beads/ invalidates the cached root
+        shutil.rmtree(Path(tmpdir) / ".beads")
+        assert tools._autodetect_workspace() is None
+        assert tools._autodetected_workspaces == {}
+
+
+def test_autodetect_workspace_drops_root_without_db(monkeypatch):
+    """Test a cached root is not reused once its database file is gone."""
+    from beads_mcp import tools
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / ".beads").mkdir()
+        db_path = Path(tmpdir) / ".beads" / "beads.db"
+        db_path.touch()
+        monkeypatch.chdir(tmpdir)
+        tools._autodetected_workspaces.clear()
+
+        assert tools._autodetect_workspace() == os.path.realpath(tmpdir)
+
+        # .beads/ is still there, but only a backup is left
+        db_path.rename(Path(tmpdir) / ".beads" / "beads.db.backup")
+        assert tools._autodetect_workspace() is None
+        assert tools._autodetected_workspaces == {}
+
+
 @pytest.mark.asyncio
 async def test_get_client_no_workspace_found():
     """Test that _get_client() raises helpful error when no workspace found."""
@@ -154,3 +195,84 @@ async def test_get_client_env_var_over_auto_detect():
                     assert client is not None
     finally:
         current_workspace.reset(token)
+
+
+def test_server_find_beads_db_walks_up_and_caches():
+    """Test server._find_beads_db finds the db from a subdirectory and caches the hit."""
+    from beads_mcp import server
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        beads_dir = Path(tmpdir) / ".beads"
+        beads_dir.mkdir()
+        db_path = beads_dir / "beads.db"
+        db_path.touch()
+
+        subdir = Path(tmpdir) / "subdir" / "deep"
+        subdir.mkdir(parents=True)
+
+        server._db_cache.clear()
+        try:
+            assert server._find_beads_db(str(subdir)) == str(db_path)
+
+            # Second lookup is served from the cache without rescanning
+            with patch("beads_mcp.tools.os.scandir") as mock_scandir:
+                assert server._find_beads_db(str(subdir)) == str(db_path)
+                mock_scandir.assert_not_called()
+        finally:
+            server._db_cache.clear()
+
+
+def test_server_find_beads_db_drops_stale_cache_entry():
+    """Test server._find_beads_db rescans when the cached database is gone."""
+    from beads_mcp import server
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        beads_dir = Path(tmpdir) / ".beads"
+        beads_dir.mkdir()
+        old_db = beads_dir / "old.db"
+        old_db.touch()
+
+        server._db_cache.clear()
+        try:
+            assert server._find_beads_db(tmpdir) == str(old_db)
+
+            old_db.unlink()
+            new_db = beads_dir / "new.db"
+            new_db.touch()
+
+            assert server._find_beads_db(tmpdir) == str(new_db)
+            assert server._db_cache[tmpdir] == str(new_db)
+        finally:
+            server._db_cache.clear()
+
+
+def test_server_find_beads_db_not_found():
+    """Test server._find_beads_db returns None and caches nothing when no db exists."""
+    from beads_mcp import server
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / ".beads").mkdir()
+
+        server._db_cache.clear()
+        assert server._find_beads_db(tmpdir) is None
+        assert tmpdir not in server._db_cache
+
+
+def test_server_find_beads_db_skips_backups():
+    """Test server._find_beads_db ignores backup files like the CWD auto-detection does."""
+    from beads_mcp import server
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        beads_dir = Path(tmpdir) / ".beads"
+        beads_dir.mkdir()
+        (beads_dir / "beads.db.backup.db").touch()
+
+        server._db_cache.clear()
+        try:
+            assert server._find_beads_db(tmpdir) is None
+
+            db_path = beads_dir / "beads.db"
+            db_path.touch()
+            assert server._find_beads_db(tmpdir) == str(db_path)
+        finally:
+            server._db_cache.clear()